@@ -1,10 +1,6 @@
-from .pipe import Grid, TraversalState
+from .pipe import Loop
 
 
 def a(input: str) -> str:
-    grid = Grid.build_from_str(input)
-    state = TraversalState.build_from_start(grid.start_position, grid.tiles[grid.start_position[1]][grid.start_position[0]])
-    while True:
-        state = state.next(grid)
-        if state.has_looped():
-            return str(state.n_steps())
\ No newline at end of file
+    loop = Loop.trace(input)
+    return str(loop.farthest_distance())
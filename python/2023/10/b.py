@@ -1,13 +1,7 @@
-from .pipe import Grid, TraversalState
+from .pipe import Loop
 
 
 def b(input: str) -> str:
-    grid = Grid.build_from_str(input)
-    state = TraversalState.build_from_start(grid.start_position, grid.tiles[grid.start_position[1]][grid.start_position[0]])
-    while True:
-        state = state.next(grid)
-        if state.has_looped():
-            break
-    perimiter = state.as_perimeter(grid)
-    result = perimiter.count_points_inside()
-    return str(result)
\ No newline at end of file
+    loop = Loop.trace(input)
+    result = loop.count_points_inside()
+    return str(result)
@@ -1,6 +1,23 @@
 from dataclasses import dataclass
-from typing import NamedTuple
-from itertools import combinations
+from typing import Iterable, NamedTuple
+from itertools import accumulate, combinations
+
+
+def empty_before(values: Iterable[int]) -> list[int]:
+    """For each index up to the largest value, how many indices before it hold no value."""
+    values = list(values)
+    occupied = bytearray(max(values) + 1)
+    for value in values:
+        occupied[value] = 1
+    return list(accumulate((1 - is_occupied for is_occupied in occupied), initial=0))
+
+
+def pairwise_distance_sum(values: Iterable[int]) -> int:
+    """The sum of |a - b| over all pairs, without building the pairs."""
+    # Once sorted, the i-th value is subtracted from the i values below it and has the rest subtracted from it.
+    ordered = sorted(values)
+    n = len(ordered)
+    return sum(value * (2 * i - n + 1) for i, value in enumerate(ordered))
 
 class Point(NamedTuple):
     x: int
@@ -19,28 +36,20 @@ class Universe:
         return expanded_all
     
     def expand_x(self, factor: int) -> 'Universe':
-        # Find empty columns.
-        x_values = set(point.x for point in self.galaxies)
-        n_cols = max(x_values) + 1
-        empty_cols = set(range(n_cols)) - x_values
+        # How many empty columns are there to the left of each column?
+        empty_cols_before = empty_before(point.x for point in self.galaxies)
         new_points = []
         for point in self.galaxies:
-            # How many empty columns are there to the left of this point?
-            adjust_factor = len([col for col in empty_cols if col < point.x])
-            adjust_factor *= (factor - 1)
+            adjust_factor = empty_cols_before[point.x] * (factor - 1)
             new_points.append(Point(point.x + adjust_factor, point.y))
         return Universe(new_points)
 
     def expand_y(self, factor: int) -> 'Universe':
-        # Find empty rows.
-        y_values = set(point.y for point in self.galaxies)
-        n_rows = max(y_values) + 1
-        empty_rows = set(range(n_rows)) - y_values
+        # How many empty rows are there above each row?
+        empty_rows_before = empty_before(point.y for point in self.galaxies)
         new_points = []
         for point in self.galaxies:
-            # How many empty rows are there above this point?
-            adjust_factor = len([row for row in empty_rows if row < point.y])
-            adjust_factor *= (factor - 1)
+            adjust_factor = empty_rows_before[point.y] * (factor - 1)
             new_points.append(Point(point.x, point.y + adjust_factor))
         return Universe(new_points)
     
@@ -48,18 +57,33 @@ class Universe:
         return list(combinations(self.galaxies, 2))
     
     def sum_of_all_distances(self) -> int:
-        pairs = self.all_galaxy_pairs()
-        distances = [pair[0].manhattan_dist(pair[1]) for pair in pairs]
-        return sum(distances)
+        # Manhattan distance splits by axis, so sum each axis on its own.
+        xs = pairwise_distance_sum(point.x for point in self.galaxies)
+        ys = pairwise_distance_sum(point.y for point in self.galaxies)
+        return xs + ys
+
+    def expanded_distance_sums(self, factors: Iterable[int]) -> list[int]:
+        """The sum of all distances after expanding by each factor, computing the expensive parts once."""
+        # Every empty row or column between two galaxies adds (factor - 1) to their distance, so
+        # the total is the unexpanded sum plus (factor - 1) times the pairwise sum of empty counts.
+        empty_cols_before = empty_before(point.x for point in self.galaxies)
+        empty_rows_before = empty_before(point.y for point in self.galaxies)
+        base = self.sum_of_all_distances()
+        gaps = (
+            pairwise_distance_sum(empty_cols_before[point.x] for point in self.galaxies)
+            + pairwise_distance_sum(empty_rows_before[point.y] for point in self.galaxies)
+        )
+        return [base + (factor - 1) * gaps for factor in factors]
     
     @classmethod
     def build_from_str(cls, input: str) -> 'Universe':
         galaxies = []
         lines = input.splitlines()
         for (y, line) in enumerate(lines):
-            for (x, char) in enumerate(line):
-                if char == '#':
-                    galaxies.append(Point(x, y))
+            x = line.find('#')
+            while x != -1:
+                galaxies.append(Point(x, y))
+                x = line.find('#', x + 1)
         return cls(galaxies)
 
     def __str__(self) -> str:
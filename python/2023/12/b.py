@@ -1,4 +1,4 @@
-from .spring import SpringArrangementReading
+from .spring import SpringArrangementReading, arrangement_counts
 
 UNFOLD_FACTOR = 5
 
@@ -6,6 +6,5 @@ UNFOLD_FACTOR = 5
 def b(input: str) -> str:
     readings = [SpringArrangementReading.build_from_line(line) for line in input.splitlines()]
     readings = [reading.unfold(UNFOLD_FACTOR) for reading in readings]
-    print(readings[0])
-    arrangement_counts = [reading.arrangement_count() for reading in readings]
-    return str(sum(arrangement_counts))
\ No newline at end of file
+    counts = arrangement_counts(readings)
+    return str(sum(counts))
@@ -1,3 +1,4 @@
+from concurrent.futures import ProcessPoolExecutor
 from itertools import repeat, chain
 from enum import StrEnum
 from dataclasses import dataclass
@@ -83,6 +84,54 @@ class SpringArrangementReading:
             return arrangements
     
     def arrangement_count(self) -> int:
-        print('arrangement_count')
-        return len(self.all_arrangements())
+        return count_arrangements(''.join(self.springs), self.damaged_counts)
+
+
+def count_arrangements(springs: str, damaged_counts: list[int]) -> int:
+    """Count the arrangements matching a reading, without building any of them."""
+    n = len(springs)
+    n_groups = len(damaged_counts)
+    # operational_before[i] is the number of known-operational springs before index i, so a
+    # window can hold a damaged group exactly when the count doesn't change across it.
+    operational_before = [0]
+    for spring in springs:
+        operational_before.append(operational_before[-1] + (spring == SpringStateReading.Operational))
+
+    # ways[i][j] is the number of ways to place groups j onward in springs i onward.
+    # Row n + 1 stands in for "just past the end", which placing a group at the very end can reach.
+    ways = [[0] * (n_groups + 1) for _ in range(n + 2)]
+    ways[n][n_groups] = ways[n + 1][n_groups] = 1
+    for i in range(n - 1, -1, -1):
+        spring = springs[i]
+        # With every group placed, the rest must all be able to be operational.
+        ways[i][n_groups] = 0 if spring == SpringStateReading.Damaged else ways[i + 1][n_groups]
+        for j in range(n_groups):
+            total = 0
+            if spring != SpringStateReading.Damaged:
+                # Leave this spring operational.
+                total += ways[i + 1][j]
+            size = damaged_counts[j]
+            end = i + size
+            if (
+                spring != SpringStateReading.Operational
+                and end <= n
+                and operational_before[end] == operational_before[i]
+                and (end == n or springs[end] != SpringStateReading.Damaged)
+            ):
+                # Start group j here, followed by an operational spring (or the end).
+                total += ways[end + 1][j + 1]
+            ways[i][j] = total
+    return ways[0][0]
+
+
+def _count_reading(reading: SpringArrangementReading) -> int:
+    return reading.arrangement_count()
+
+
+def arrangement_counts(readings: list[SpringArrangementReading], workers: int | None = None) -> list[int]:
+    """Count arrangements for many readings, fanned out over a process pool unless workers is 1."""
+    if workers == 1:
+        return [reading.arrangement_count() for reading in readings]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_count_reading, readings, chunksize=max(len(readings) // 64, 1)))
             
\ No newline at end of file
@@ -1,7 +1,8 @@
-from .pattern import Pattern
+from puzzle_input import PuzzleInput, takes_puzzle_input
 
+from .pattern import total_reflect_score
 
-def b(input: str) -> str:
-    patterns = [Pattern.build_from_str(s) for s in input.split("\n\n")]
-    scores = [pattern.find_reflect_score(mismatches=1) for pattern in patterns]
-    return str(sum(scores))
\ No newline at end of file
+
+@takes_puzzle_input
+def b(input: PuzzleInput) -> str:
+    return str(total_reflect_score(input.sections(), mismatches=1))
@@ -1,77 +1,48 @@
 from dataclasses import dataclass
-from typing import NamedTuple
+from typing import Iterable
 
+# Rocks become 1 bits, ash 0 bits.
+TO_BITS = str.maketrans('#.', '10')
 
-class Point(NamedTuple):
-    x: int
-    y: int
+
+def find_reflection(lines: list[int], mismatches: int = 0) -> int | None:
+    """Find the line index just before a reflection with exactly this many mismatched cells."""
+    for line in range(len(lines) - 1):
+        # Work outward from the reflection, one pair of lines at a time.
+        mismatches_found = 0
+        before, after = line, line + 1
+        while before >= 0 and after < len(lines):
+            mismatches_found += (lines[before] ^ lines[after]).bit_count()
+            if mismatches_found > mismatches:
+                # Once we've found too many mismatches, there's no point finding more.
+                break
+            before -= 1
+            after += 1
+        if mismatches_found == mismatches:
+            return line
+    return None
 
 
 @dataclass
 class Pattern:
-    rocks: list[Point]
+    # Each row and column as a bitmask of its rocks, most significant bit first.
+    rows: list[int]
+    cols: list[int]
 
     @classmethod
     def build_from_str(cls, input: str) -> "Pattern":
-        rocks = []
-        for y, line in enumerate(input.splitlines()):
-            for x, char in enumerate(line):
-                if char == "#":
-                    rocks.append(Point(x, y))
-        return cls(rocks)
-    
+        lines = input.splitlines()
+        rows = [int(line.translate(TO_BITS), 2) for line in lines]
+        cols = [int(''.join(col).translate(TO_BITS), 2) for col in zip(*lines)]
+        return cls(rows, cols)
 
     def find_horizontal_reflection(self, mismatches: int = 0) -> int | None:
-        # Where is the line over which this pattern is symmetrical?
-        max_x = max(rock.x for rock in self.rocks)
-        max_y = max(rock.y for rock in self.rocks)
-        for x_line in range(0, max_x):
-            # The line actually runs between two points.
-            x_line = x_line + 0.5
-            # Start at this point and work to the right.
-            x = x_line + 0.5
-            reflected_x = x_line - 0.5
-            mismatches_found = 0
-            while x <= max_x and reflected_x >= 0:
-                for y in range(0, max_y + 1):
-                    is_rock = Point(x, y) in self.rocks
-                    is_reflected_rock = Point(reflected_x, y) in self.rocks
-                    if is_rock != is_reflected_rock:
-                        mismatches_found += 1
-                        if mismatches_found > mismatches:
-                            # Once we've found too many mismatches, there's no point finding more.
-                            break
-                x += 1
-                reflected_x -= 1
-            if mismatches_found == mismatches:
-                return int(x_line - 0.5)
-        return None
+        # A reflection across a vertical line compares whole columns.
+        return find_reflection(self.cols, mismatches=mismatches)
 
     def find_vertical_reflection(self, mismatches: int = 0) -> int | None:
-        # Where is the line over which this pattern is symmetrical?
-        max_x = max(rock.x for rock in self.rocks)
-        max_y = max(rock.y for rock in self.rocks)
-        for y_line in range(0, max_y):
-            # The line actually runs between two points.
-            y_line = y_line + 0.5
-            # Start at this point and work down.
-            y = y_line + 0.5
-            reflected_y = y_line - 0.5
-            mismatches_found = 0
-            while y <= max_y and reflected_y >= 0:
-                for x in range(0, max_x + 1):
-                    is_rock = Point(x, y) in self.rocks
-                    is_reflected_rock = Point(x, reflected_y) in self.rocks
-                    if is_rock != is_reflected_rock:
-                        mismatches_found += 1
-                        if mismatches_found > mismatches:
-                            # Once we've found too many mismatches, there's no point finding more.
-                            break
-                y += 1
-                reflected_y -= 1
-            if mismatches_found == mismatches:
-                return int(y_line - 0.5)
-        return None
+        # A reflection across a horizontal line compares whole rows.
+        return find_reflection(self.rows, mismatches=mismatches)
     
     def find_reflect_score(self, mismatches: int = 0) -> int:
         vert_score = self.find_vertical_reflection(mismatches=mismatches)
@@ -83,15 +54,10 @@ class Pattern:
         raise RuntimeError("no symmetry")
     
     def __str__(self) -> str:
-        max_x = max(rock.x for rock in self.rocks)
-        max_y = max(rock.y for rock in self.rocks)
-        lines = []
-        for y in range(0, max_y + 1):
-            line = []
-            for x in range(0, max_x + 1):
-                if Point(x, y) in self.rocks:
-                    line.append("#")
-                else:
-                    line.append(".")
-            lines.append("".join(line))
-        return "\n".join(lines)
\ No newline at end of file
+        width = len(self.cols)
+        return "\n".join(f"{row:0{width}b}".replace("1", "#").replace("0", ".") for row in self.rows)
+
+
+def total_reflect_score(sections: Iterable[str], mismatches: int = 0) -> int:
+    """Score every pattern in a stream of sections, one pattern at a time."""
+    return sum(Pattern.build_from_str(section).find_reflect_score(mismatches=mismatches) for section in sections)
@@ -5,24 +5,20 @@ N = 1_000_000_000
 
 def b(input: str) -> str:
     platform = Platform.build_from_str(input)
-    hashes = {}
+    seen = {platform.fingerprint(): 0}
+    loads = [platform.load()]
     cycles = 0
     while True:
-        print(f'Cycle {cycles}...')
         platform.tilt_cyle()
         cycles += 1
-        hash = platform.rounded_rock_hash()
-        if hash in hashes:
-            print(f'Cycle {cycles} matches cycle {hashes[hash]}')
-            first_seen = hashes[hash]
-            cycle_length = cycles - hashes[hash]
+        fingerprint = platform.fingerprint()
+        if fingerprint in seen:
+            first_seen = seen[fingerprint]
+            cycle_length = cycles - first_seen
             break
-        hashes[hash] = cycles
-    print(f'First seen at {first_seen}, cycle length {cycle_length}')
-    remaining_cycles = N - first_seen
-    # We can skip even numbers of loops because they don't change the board.
-    remaining_cycles %= cycle_length
-    for i in range(remaining_cycles):
-        platform.tilt_cyle()
-    load = platform.load()
-    return str(load)
\ No newline at end of file
+        seen[fingerprint] = cycles
+        loads.append(platform.load())
+    # Every state from first_seen onward repeats with period cycle_length, so look the answer up.
+    remaining_cycles = (N - first_seen) % cycle_length
+    load = loads[first_seen + remaining_cycles]
+    return str(load)
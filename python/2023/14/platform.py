@@ -1,43 +1,47 @@
-from dataclasses import dataclass
-from functools import reduce
+from dataclasses import dataclass, field
 from typing import Literal
-from operator import xor
 
 
 Direction = Literal['North', 'East', 'South', 'West']
 
-
-@dataclass
-class Point:
-    x: int
-    y: int
-
-    def to(self, direction: Direction) -> 'Point':
-        match direction:
-            case 'North':
-                return Point(self.x, self.y - 1)
-            case 'South':
-                return Point(self.x, self.y + 1)
-            case 'West':
-                return Point(self.x - 1, self.y)
-            case 'East':
-                return Point(self.x + 1, self.y)
-    
-    def set_at(self, p: 'Point'):
-        # Update in-place
-        self.x = p.x
-        self.y = p.y
-    
-    def fake_hash(self):
-        return hash((self.x, self.y))
+ROUNDED = ord('O')
+CUBE = ord('#')
+EMPTY = ord('.')
 
 
 @dataclass
 class Platform:
     width: int
     height: int
-    rounded_rocks: list[Point]
-    cube_rocks: list[Point]
+    # One byte per cell, row by row.
+    cells: bytearray
+    # The runs of cells between cube rocks (or the edges), as slices of cells running left to right
+    # for rows and top to bottom for columns. Rounded rocks only ever move within their run.
+    row_segments: list[slice] = field(init=False, repr=False)
+    col_segments: list[slice] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.row_segments = []
+        for y in range(self.height):
+            row_start = y * self.width
+            self.row_segments.extend(self._segments(row_start, 1, self.width))
+        self.col_segments = []
+        for x in range(self.width):
+            self.col_segments.extend(self._segments(x, self.width, self.height))
+
+    def _segments(self, start: int, step: int, length: int) -> list[slice]:
+        segments = []
+        segment_start = start
+        for i in range(length):
+            idx = start + i * step
+            if self.cells[idx] == CUBE:
+                if idx > segment_start:
+                    segments.append(slice(segment_start, idx, step))
+                segment_start = idx + step
+        end = start + length * step
+        if end > segment_start:
+            segments.append(slice(segment_start, end, step))
+        return segments
 
     def tilt_cyle(self):
         self.tilt('North')
@@ -46,65 +50,39 @@ class Platform:
         self.tilt('East')
 
     def tilt(self, direction: Direction):
-        # Start at the row/column closest to the direction
-        # and move towards the opposite side.
-        match direction:
-            case 'North':
-                sorted_rocks = sorted(self.rounded_rocks, key=lambda p: p.y)
-            case 'South':
-                sorted_rocks = sorted(self.rounded_rocks, key=lambda p: -p.y)
-            case 'West':
-                sorted_rocks = sorted(self.rounded_rocks, key=lambda p: p.x)
-            case 'East':
-                sorted_rocks = sorted(self.rounded_rocks, key=lambda p: -p.x)
-        for rock in sorted_rocks:
-            self.roll_rock(rock, direction) 
-
-    def roll_rock(self, rock: Point, direction: Direction):
-        # While the next position in *direction* is on the board and unoccupied, move the rock.
-        while True:
-            next_pos = rock.to(direction)
-            if next_pos.x >= self.width or next_pos.y >= self.height or next_pos.x < 0 or next_pos.y < 0:
-                break
-            if next_pos in self.rounded_rocks or next_pos in self.cube_rocks:
-                break
-            rock.set_at(next_pos)
+        # Within each run, the rounded rocks all end up packed against one end.
+        segments = self.col_segments if direction in ('North', 'South') else self.row_segments
+        toward_start = direction in ('North', 'West')
+        cells = self.cells
+        for segment in segments:
+            contents = cells[segment]
+            rounded = contents.count(ROUNDED)
+            if rounded == 0:
+                continue
+            empty = len(contents) - rounded
+            if toward_start:
+                cells[segment] = b'O' * rounded + b'.' * empty
+            else:
+                cells[segment] = b'.' * empty + b'O' * rounded
 
     @classmethod
     def build_from_str(cls, input: str) -> 'Platform':
-        rounded_rocks = []
-        cube_rocks = []
-        width = 0
-        height = 0
-        for (y, line) in enumerate(input.splitlines()):
-            height += 1
-            width = max(width, len(line))
-            for (x, char) in enumerate(line):
-                if char == 'O':
-                    rounded_rocks.append(Point(x, y))
-                elif char == '#':
-                    cube_rocks.append(Point(x, y))
-        return cls(width, height, rounded_rocks, cube_rocks)
+        lines = input.splitlines()
+        width = max(len(line) for line in lines)
+        cells = bytearray(b''.join(line.ljust(width, '.').encode() for line in lines))
+        return cls(width, len(lines), cells)
     
     def load(self) -> int:
         load = 0
-        for rock in self.rounded_rocks:
-            load += self.height - rock.y
+        for y in range(self.height):
+            row_start = y * self.width
+            load += (self.height - y) * self.cells.count(ROUNDED, row_start, row_start + self.width)
         return load
     
     def __str__(self):
-        s = ''
-        for y in range(self.height):
-            for x in range(self.width):
-                if Point(x, y) in self.rounded_rocks:
-                    s += 'O'
-                elif Point(x, y) in self.cube_rocks:
-                    s += '#'
-                else:
-                    s += '.'
-            s += '\n'
-        return s
+        rows = [self.cells[y * self.width:(y + 1) * self.width].decode() for y in range(self.height)]
+        return '\n'.join(rows) + '\n'
     
-    def rounded_rock_hash(self):
-        return reduce(xor, (rock.fake_hash() for rock in self.rounded_rocks))
-            
\ No newline at end of file
+    def fingerprint(self) -> bytes:
+        """An exact snapshot of the platform, usable as a dict key."""
+        return bytes(self.cells)
@@ -1,8 +1,7 @@
-from .hash import ascii_hash
+from .hash import hash_steps
 
 
 def a(input: str) -> str:
-    pieces = input.strip().split(",")
-    hashes = list(ascii_hash(piece) for piece in pieces)
+    hashes = hash_steps(input.encode())
     result = sum(hashes)
-    return str(result)
\ No newline at end of file
+    return str(result)
@@ -1,10 +1,8 @@
-from .hash import Instruction, State
+from .hash import State
 
 
 def b(input: str) -> str:
     pieces = input.strip().split(",")
-    instrs = list(Instruction.build_from_string(piece) for piece in pieces)
     state = State()
-    for i in instrs:
-        state.execute(i)
-    return str(state.focusing_power())
\ No newline at end of file
+    state.execute_steps(pieces)
+    return str(state.focusing_power())
@@ -1,22 +1,32 @@
 from dataclasses import dataclass
-from typing import Literal
-from collections import defaultdict, OrderedDict
+from math import sumprod
+from typing import Iterable, Literal
 
 
 class State:
-    boxes: dict[int, OrderedDict[str, int]]
+    # Plain dicts keep insertion order, which is exactly the lens order within a box.
+    boxes: list[dict[str, int]]
 
     def __init__(self):
-        self.boxes = defaultdict(OrderedDict)
+        self.boxes = [{} for _ in range(256)]
+        self._label_boxes: dict[str, int] = {}
     
     def __str__(self):
         s = ''
-        for box in sorted(self.boxes.keys()):
-            s += f'Box {box}: {self.boxes[box]}\n'
+        for box, lenses in enumerate(self.boxes):
+            if lenses:
+                s += f'Box {box}: {lenses}\n'
         return s
+
+    def box(self, label: str) -> int:
+        # Labels repeat a lot, so only hash each one once.
+        box_num = self._label_boxes.get(label)
+        if box_num is None:
+            box_num = self._label_boxes[label] = ascii_hash(label)
+        return box_num
     
     def execute(self, i: 'Instruction'):
-        box_num = i.box()
+        box_num = self.box(i.label)
         match i:
             case Instruction(label, '-', None):
                 if label in self.boxes[box_num]:
@@ -26,9 +36,19 @@ class State:
             case _:
                 raise RuntimeError(f'Invalid instruction: {i}')
     
+    def execute_steps(self, steps: Iterable[str]):
+        """Execute raw steps like 'rn=1' or 'cm-', without building an Instruction for each."""
+        for step in steps:
+            if step[-1] == '-':
+                label = step[:-1]
+                self.boxes[self.box(label)].pop(label, None)
+            else:
+                label, focal_length = step.split('=')
+                self.boxes[self.box(label)][label] = int(focal_length)
+    
     def focusing_power(self) -> int:
         sum = 0
-        for box_num, lenses in self.boxes.items():
+        for box_num, lenses in enumerate(self.boxes):
             for slot_num, label in enumerate(lenses):
                 focus_power = (slot_num + 1) * lenses[label] * (box_num + 1)
                 sum += focus_power
@@ -57,10 +77,15 @@ class Instruction:
 
 
 def ascii_hash(s: str) -> int:
-    current_val = 0
-    # Get the ascii code of each character in the string
-    for c in s:
-        current_val += ord(c)
-        current_val *= 17
-        current_val %= 256
-    return current_val
+    return bytes_hash(s.encode())
+
+
+def bytes_hash(b: bytes) -> int:
+    # Since 17^k = 1 + 16k (mod 256), the running add-then-multiply-by-17 collapses to
+    # sum(c_i * (1 + 16 * (n - i))), which two C-level sums compute without a Python loop per character.
+    return (sum(b) + 16 * sumprod(b, range(len(b), 0, -1))) % 256
+
+
+def hash_steps(data: bytes) -> list[int]:
+    """HASH every comma-separated step of an initialization sequence."""
+    return [bytes_hash(step) for step in data.strip().split(b',')]
@@ -1,11 +1,6 @@
-from .beam import Grid, BeamGrid, Beam
+from .beam import Contraption, RIGHT
 
 
 def a(input: str) -> str:
-    grid = Grid.build_from_str(input)
-    beam_grid = BeamGrid(grid=grid, origin=Beam(at=(0, 0), parent_origin=(-1, 0)))
-
-    while len(beam_grid.active) > 0:
-        beam_grid.next()
-
-    return str(beam_grid.energized_count())
\ No newline at end of file
+    contraption = Contraption.build_from_str(input)
+    return str(contraption.energized_count(0, 0, RIGHT))
@@ -1,196 +1,181 @@
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
-from typing import Literal
 
-@dataclass
-class Mirror:
-    mirror: Literal['/', '\\']
+# Directions, as indexes into DX/DY.
+UP, RIGHT, DOWN, LEFT = 0, 1, 2, 3
+DX = (0, 1, 0, -1)
+DY = (-1, 0, 1, 0)
 
-    def __str__(self) -> str:
-        return self.mirror
+# The directions a beam leaves each kind of tile, indexed by the direction it was heading.
+TURNS = {
+    '.': ((UP,), (RIGHT,), (DOWN,), (LEFT,)),
+    '/': ((RIGHT,), (UP,), (LEFT,), (DOWN,)),
+    '\\': ((LEFT,), (DOWN,), (RIGHT,), (UP,)),
+    '|': ((UP,), (UP, DOWN), (DOWN,), (UP, DOWN)),
+    '-': ((LEFT, RIGHT), (RIGHT,), (LEFT, RIGHT), (LEFT,)),
+}
 
-@dataclass
-class Splitter:
-    splitter: Literal['|', '-']
-
-    def __str__(self) -> str:
-        return self.splitter
-    
 
 @dataclass
-class Beam:
-    at: tuple[int, int]
-    parent_origin: tuple[int, int] | None = None
-    parent: 'Beam | None' = None
-    next: list['Beam'] = field(default_factory=list)
-
-    def add_child_at(self, at: tuple[int, int]) -> 'Beam':
-        child = Beam(at=at, parent=self)
-        self.next.append(child)
-        return child
-    
-    def next_positions(self, grid: 'Grid') -> list[tuple[int, int]]:
-        # The first position doesn't have a parent so we need to fall back to the "parent
-        # origin" - the place off edge where the beam "started".
-        parent = self.parent if self.parent is not None else Beam(self.parent_origin)
-        # Figure out which direction we're coming from.
-        d_x, d_y = self.at[0] - parent.at[0], self.at[1] - parent.at[1]
-        next = []
-        match (d_x, d_y):
-            case (0, 1):
-                match grid[self.at]:
-                    # Coming from above.
-                    case '.' | Splitter('|'):
-                        # Keep going down.
-                        next.append((self.at[0], self.at[1] + 1))
-                    case Mirror('/'):
-                        # Go left.
-                        next.append((self.at[0] - 1, self.at[1]))
-                    case Mirror('\\'):
-                        # Go right.
-                        next.append((self.at[0] + 1, self.at[1]))
-                    case Splitter('-'):
-                        # Go both left and right.
-                        next.append((self.at[0] - 1, self.at[1]))
-                        next.append((self.at[0] + 1, self.at[1]))
-                    case _:
-                        raise RuntimeError(f'Unexpected item {grid[self.at]} at {self.at}') 
-            case (0, -1):
-                # Coming from below.
-                match grid[self.at]:
-                    case '.' | Splitter('|'):
-                        # Keep going up.
-                        next.append((self.at[0], self.at[1] - 1))
-                    case Mirror('/'):
-                        # Go right.
-                        next.append((self.at[0] + 1, self.at[1]))
-                    case Mirror('\\'):
-                        # Go left.
-                        next.append((self.at[0] - 1, self.at[1]))
-                    case Splitter('-'):
-                        # Go both left and right.
-                        next.append((self.at[0] - 1, self.at[1]))
-                        next.append((self.at[0] + 1, self.at[1]))
-                    case _:
-                        raise RuntimeError(f'Unexpected item {grid[self.at]} at {self.at}') 
-            case (1, 0):
-                # Coming from the left.
-                match grid[self.at]:
-                    case '.' | Splitter('-'):
-                        # Keep going right.
-                        next.append((self.at[0] + 1, self.at[1]))
-                    case Mirror('/'):
-                        # Go up.
-                        next.append((self.at[0], self.at[1] - 1))
-                    case Mirror('\\'):
-                        # Go down.
-                        next.append((self.at[0], self.at[1] + 1))
-                    case Splitter('|'):
-                        # Go both up and down.
-                        next.append((self.at[0], self.at[1] - 1))
-                        next.append((self.at[0], self.at[1] + 1))
-                    case _:
-                        raise RuntimeError(f'Unexpected item {grid[self.at]} at {self.at}') 
-            case (-1, 0):
-                # Coming from the right.
-                match grid[self.at]:
-                    case '.' | Splitter('-'):
-                        # Keep going left.
-                        next.append((self.at[0] - 1, self.at[1]))
-                    case Mirror('/'):
-                        # Go down.
-                        next.append((self.at[0], self.at[1] + 1))
-                    case Mirror('\\'):
-                        # Go up.
-                        next.append((self.at[0], self.at[1] - 1))
-                    case Splitter('|'):
-                        # Go both up and down.
-                        next.append((self.at[0], self.at[1] - 1))
-                        next.append((self.at[0], self.at[1] + 1))
-                    case _:
-                        raise RuntimeError(f'Unexpected item {grid[self.at]} at {self.at}') 
-            case _:
-                raise RuntimeError(f'Unexpected direction {d_x}, {d_y}')
-        return next
-        
-    def add_next_children(self, grid: 'Grid') -> list['Beam']:
-        next_positions = self.next_positions(grid)
-        # Trim any positions that aren't on the grid.
-        next_positions = [
-            position for position in next_positions
-            if 0 <= position[0] < grid.width and 0 <= position[1] < grid.height
-        ]
-        next_children = []
-        for position in next_positions:
-            child = self.add_child_at(position)
-            next_children.append(child)
-        return next_children
-    
-    def all_points(self) -> list[tuple[int, int]]:
-        points = [self.at]
-        for child in self.next:
-            points.extend(child.all_points())
-        return points
+class Split:
+    """A splitter hit side-on. Its two beams energize `cells` and then run into the splitters in `leads_to`."""
+    cells: int
+    leads_to: list[int]
+    # Every cell energized from here on, as a bitset, filled in once the whole graph is known.
+    reach: int = 0
 
 
 @dataclass
-class Grid:
+class Contraption:
     width: int
     height: int
-    items: list[list[Literal['.'] | Mirror | Splitter]]
+    # One tile character per cell, row by row.
+    tiles: str
+    # Keyed by the splitter's cell index.
+    splits: dict[int, Split] = field(default_factory=dict, repr=False)
 
     @classmethod
-    def build_from_str(cls, input: str) -> 'Grid':
-        items = []
-        for (y, line) in enumerate(input.splitlines()):
-            if y == 0:
-                width = len(line)
-            row = []
-            for (x, char) in enumerate(line):
-                if char == '.':
-                    row.append('.')
-                elif char in ['/', '\\']:
-                    row.append(Mirror(char))
-                elif char in ['|', '-']:
-                    row.append(Splitter(char))
-                else:
-                    raise ValueError(f'Unknown character {char}')
-            items.append(row)
-        return Grid(height=y+1, width=width, items=items)
-    
-    def __getitem__(self, key: tuple[int, int]) -> Literal['.'] | Mirror | Splitter:
-        return self.items[key[1]][key[0]]
-    
-    def __str__(self) -> str:
-        return '\n'.join(''.join(str(item) for item in row) for row in self.items)
+    def build_from_str(cls, input: str) -> 'Contraption':
+        rows = input.splitlines()
+        return cls(len(rows[0]), len(rows), ''.join(rows))
 
+    def _trace(self, x: int, y: int, direction: int) -> tuple[int, int | None]:
+        """
+        Follow a beam entering (x, y) until it leaves the grid or hits a splitter side-on.
 
-@dataclass
-class BeamGrid:
-    origin: Beam
-    grid: Grid
-    active: list[Beam] = field(default_factory=list)
-    seen: set[None | tuple[int, int], None | tuple[int, int]] = field(default_factory=set)
-
-    def next(self) -> None:
-        new_active = []
-        for beam in self.active:
-            next = beam.add_next_children(self.grid)
-            for next_beam in next:
-                # Keep track of what parent -> child pairs we've seen, and only bother adding new ones.
-                if (beam.at, next_beam.at) not in self.seen:
-                    new_active.append(next_beam)
-                    self.seen.add((beam.at, next_beam.at))
-        self.active = new_active
-
-    def __post_init__(self) -> None:
-        self.active.append(self.origin)
+        Returns the energized cells as a bitset, and the cell index of the splitter it ended on, if any.
+        """
+        width, height, tiles = self.width, self.height, self.tiles
+        mask = bytearray((width * height + 7) // 8)
+        # Beams through mirrors are reversible, so one that starts on an edge or at a splitter can't get
+        # stuck in a loop without a splitter; the step limit is only a guard.
+        for _ in range(4 * width * height):
+            if not (0 <= x < width and 0 <= y < height):
+                break
+            cell = y * width + x
+            mask[cell >> 3] |= 1 << (cell & 7)
+            leaving = TURNS[tiles[cell]][direction]
+            if len(leaving) == 2:
+                return int.from_bytes(mask, 'little'), cell
+            direction = leaving[0]
+            x += DX[direction]
+            y += DY[direction]
+        return int.from_bytes(mask, 'little'), None
+
+    def _build_splits(self, start: int) -> None:
+        # Explore every split reachable from this one, tracing each beam between splitters once.
+        pending = [start]
+        while pending:
+            cell = pending.pop()
+            if cell in self.splits:
+                continue
+            y, x = divmod(cell, self.width)
+            cells = 0
+            leads_to = []
+            # Hitting the splitter side-on sends beams out both ends.
+            side_on = RIGHT if self.tiles[cell] == '|' else UP
+            for direction in TURNS[self.tiles[cell]][side_on]:
+                beam_cells, split = self._trace(x + DX[direction], y + DY[direction], direction)
+                cells |= beam_cells
+                if split is not None:
+                    leads_to.append(split)
+                    pending.append(split)
+            self.splits[cell] = Split(cells | (1 << cell), leads_to)
+        self._fill_reach(start)
+
+    def _fill_reach(self, start: int) -> None:
+        """
+        Work out every split's reach by condensing the strongly connected components of the split graph.
+
+        This is Tarjan's algorithm, made iterative; components complete in reverse topological order, so
+        every component a finished component leads to already has its reach.
+        """
+        index: dict[int, int] = {}
+        lowlink: dict[int, int] = {}
+        stack: list[int] = []
+        on_stack: set[int] = set()
+        work = [(start, 0)]
+        while work:
+            node, child_idx = work.pop()
+            if child_idx == 0:
+                if node in index:
+                    continue
+                index[node] = lowlink[node] = len(index)
+                stack.append(node)
+                on_stack.add(node)
+            children = self.splits[node].leads_to
+            if child_idx < len(children):
+                work.append((node, child_idx + 1))
+                child = children[child_idx]
+                if child not in index:
+                    if self.splits[child].reach == 0:
+                        work.append((child, 0))
+                elif child in on_stack:
+                    lowlink[node] = min(lowlink[node], index[child])
+                continue
+            # All children are done; pull their lowlinks up.
+            for child in children:
+                if child in on_stack:
+                    lowlink[node] = min(lowlink[node], lowlink[child])
+            if lowlink[node] == index[node]:
+                component = []
+                while True:
+                    member = stack.pop()
+                    on_stack.discard(member)
+                    component.append(member)
+                    if member == node:
+                        break
+                reach = 0
+                for member in component:
+                    split = self.splits[member]
+                    reach |= split.cells
+                    for child in split.leads_to:
+                        reach |= self.splits[child].reach
+                for member in component:
+                    self.splits[member].reach = reach
+
+    def energized_cells(self, x: int, y: int, direction: int) -> int:
+        """The cells energized by a beam entering (x, y) heading in direction, as a bitset."""
+        cells, split = self._trace(x, y, direction)
+        if split is None:
+            return cells
+        if split not in self.splits or self.splits[split].reach == 0:
+            self._build_splits(split)
+        return cells | self.splits[split].reach
+
+    def energized_count(self, x: int, y: int, direction: int) -> int:
+        return self.energized_cells(x, y, direction).bit_count()
+
+    def edge_entries(self) -> list[tuple[int, int, int]]:
+        """Every (x, y, direction) a beam can enter the grid with from outside."""
+        entries = []
+        for x in range(self.width):
+            entries.append((x, 0, DOWN))
+            entries.append((x, self.height - 1, UP))
+        for y in range(self.height):
+            entries.append((0, y, RIGHT))
+            entries.append((self.width - 1, y, LEFT))
+        return entries
+
+    def energized_counts(self, entries: list[tuple[int, int, int]], workers: int | None = 1) -> list[int]:
+        """Energized counts for many entries, optionally spread over a process pool."""
+        if workers == 1:
+            return [self.energized_count(*entry) for entry in entries]
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(self.width, self.height, self.tiles)) as executor:
+            return list(executor.map(_worker_energized_count, entries, chunksize=max(len(entries) // 64, 1)))
 
     def __str__(self) -> str:
-        s = 'Active: ' + ','.join(str(beam.at) for beam in self.active) + '\n'
-        grid_items = [[item for item in row] for row in self.grid.items]
-        for (x, y) in self.origin.all_points():
-            grid_items[y][x] = 'X'
-        return s + '\n'.join(''.join(str(item) for item in row) for row in grid_items)
-    
-    def energized_count(self) -> int:
-        return len(set(self.origin.all_points()))
\ No newline at end of file
+        return '\n'.join(self.tiles[y * self.width:(y + 1) * self.width] for y in range(self.height))
+
+
+# Each pool worker builds its own split graph once and reuses it for every entry it's given.
+_worker_contraption: Contraption | None = None
+
+
+def _init_worker(width: int, height: int, tiles: str) -> None:
+    global _worker_contraption
+    _worker_contraption = Contraption(width, height, tiles)
+
+
+def _worker_energized_count(entry: tuple[int, int, int]) -> int:
+    return _worker_contraption.energized_count(*entry)
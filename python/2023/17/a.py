@@ -10,4 +10,4 @@ def a(input: str) -> str:
         grid=grid,
     )
     distance = traversal.find_path()
-    return distance
\ No newline at end of file
+    return distance
@@ -1,13 +1,16 @@
 from .grid import Grid, Position
-from .ultra_traversal import UltraTraversal
+from .traversal import Traversal
 
 
 def b(input: str) -> str:
     grid = Grid.from_str(input)
-    traversal = UltraTraversal(
+    # An ultra crucible has to move at least four blocks before turning or stopping, and at most ten.
+    traversal = Traversal(
         start=Position(0, 0),
         end=Position(grid.width - 1, grid.height - 1),
         grid=grid,
+        min_run=4,
+        max_run=10,
     )
     distance = traversal.find_path()
-    return distance
\ No newline at end of file
+    return distance
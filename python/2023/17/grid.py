@@ -1,40 +1,40 @@
 from dataclasses import dataclass
-from .direction import Direction
+
+# Maps each digit character to its value, so a whole row converts in one call.
+DIGIT_VALUES = bytes.maketrans(b'0123456789', bytes(range(10)))
+
 
 @dataclass(slots=True, frozen=True, order=True)
 class Position:
     x: int
     y: int
-    
+
     def __str__(self) -> str:
         return f"({self.x}, {self.y})"
 
 
 @dataclass
 class Grid:
-    heat_loss: dict[Position, int]
+    # One heat loss value per cell, row by row.
+    heat_loss: bytes
     width: int
     height: int
 
     @classmethod
     def from_str(cls, input: str) -> 'Grid':
-        heat_loss = {}
-        for y, line in enumerate(input.splitlines()):
-            for x, char in enumerate(line):
-                heat_loss[Position(x, y)] = int(char)
-        return cls(heat_loss, x + 1, y + 1)
-    
+        rows = input.split()
+        heat_loss = ''.join(rows).encode().translate(DIGIT_VALUES)
+        return cls(heat_loss, len(rows[0]), len(rows))
+
+    def index(self, position: Position) -> int:
+        return position.y * self.width + position.x
+
+    def position(self, index: int) -> Position:
+        y, x = divmod(index, self.width)
+        return Position(x, y)
+
     def __str__(self) -> str:
         return "\n".join(
-            "".join(str(self.heat_loss[Position(x, y)]) for x in range(self.width))
+            "".join(str(value) for value in self.heat_loss[y * self.width:(y + 1) * self.width])
             for y in range(self.height)
         )
-    
-    def connecting_points(self, point: Position) -> list[tuple[Direction, Position]]:
-        possible = [
-            (Direction.RIGHT, Position(point.x + 1, point.y)),
-            (Direction.LEFT, Position(point.x - 1, point.y)),
-            (Direction.DOWN, Position(point.x, point.y + 1)),
-            (Direction.UP, Position(point.x, point.y - 1)),
-        ]
-        return [p for p in possible if p[1] in self.heat_loss]
\ No newline at end of file
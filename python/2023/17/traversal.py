@@ -1,119 +1,129 @@
-from heapq import heappush, heappop
-from typing import TypeAlias
-from dataclasses import dataclass, field
+from array import array
+from dataclasses import dataclass
 
 from .direction import Direction
 from .grid import Grid, Position
 
-
-Distance: TypeAlias = int
-
-
-@dataclass(order=True, frozen=True)
-class Move:
-    distance: Distance
-    from_: Position
-    to: Position
-    recent_directions: tuple[Direction | None, Direction | None, Direction | None]
-    last: 'Move | None' = field(default=None)
-
-    def __str__(self) -> str:
-        return f"{self.distance}: {self.from_} {self.recent_directions[-1]} {self.to}"
+# Which way the crucible was moving when it stopped at a cell. It always has to turn, so the next run
+# is along the other axis.
+HORIZONTAL, VERTICAL = 0, 1
 
 
 @dataclass
 class Traversal:
     """
-    A traversal is a short-path algorithm traversal of a grid.
+    A shortest-path search for a crucible that must move between min_run and max_run cells in a
+    straight line before turning.
 
-    The "distance" between nodes is the value of the node being traveled to.
-    We use a heap to store places we've been so far, along with their distance, and pop
-    the heap to get the position that currently has the closest distance. We add all
-    valid next positions from that position (along with their distances) back to the
-    heap and repeat, until we hit the ending node.
+    Each search state is a cell plus the axis the crucible arrived along, packed into one int as
+    cell * 2 + axis. Expanding a state jumps the whole run at once, so run lengths never need to be
+    part of the state. Heat losses are small, so a bucket queue stands in for a heap.
     """
     start: Position
     end: Position
     grid: Grid
-    # This is used as a heap, so we can always pull the smallest element.
-    next_moves: list[Move] = field(init=False)
-    # This is a way to keep track of positions we've seen before, so we don't come back unless we find a shorter path.
-    seen: set[tuple, Position, tuple[Direction | None, Direction | None, Direction | None]] = field(init=False)
+    min_run: int = 1
+    max_run: int = 3
 
-    def __post_init__(self):
-        self.next_moves = []
-        for direction, position in self.grid.connecting_points(self.start):
-            distance = self.grid.heat_loss[position]
-            recent_directions = (None, None, direction)
-            heappush(self.next_moves, Move(distance, self.start, position, recent_directions))
-        self.seen = {self.start}
-    
-    def __str__(self) -> str:
-        s = ''
-        for y in range(self.grid.height):
-            for x in range(self.grid.width):
-                if Position(x, y) == self.start:
-                    s += "S"
-                elif Position(x, y) == self.end:
-                    s += "E"
-                elif Position(x, y) in self.seen:
-                    s += "X"
-                else:
-                    s += " "
-            s += "\n"
-        return s
-    
-    def _iterate(self) -> Move | None:
-        # Grab the closest position we've seen so far.
-        next_move = heappop(self.next_moves)
-        if (next_move.to, next_move.recent_directions) in self.seen:
-            return None
-        # Add it to the seen list.
-        self.seen.add((next_move.to, next_move.recent_directions))
-        # We can't go backward, so determine what that direction is.
-        cant_go = {next_move.recent_directions[-1].opposite()}
-        # If this move has now led us to go three times in the same direction, we also
-        # need to remember not to go that way again.
-        if len(set(next_move.recent_directions)) == 1:
-            cant_go.add(next_move.recent_directions[0])
+    def _search(self, track_route: bool) -> tuple[int, int, array | None]:
+        """Returns the total heat loss, the final state, and each state's predecessor if tracking the route."""
+        grid = self.grid
+        heat_loss, width, height = grid.heat_loss, grid.width, grid.height
+        min_run, max_run = self.min_run, self.max_run
+        end = grid.index(self.end)
+
+        unreached = width * height * 9 * max_run + 1
+        distances = array('q', [unreached]) * (2 * width * height)
+        previous = array('q', [-1]) * (2 * width * height) if track_route else None
+        # No single run loses more heat than this, so a ring of this many buckets never wraps onto a
+        # distance that's still pending.
+        bucket_count = max(heat_loss) * max_run + 1
+        buckets: list[list[int]] = [[] for _ in range(bucket_count)]
 
-        # Add all valid next positions to the heap.
-        for direction, position in self.grid.connecting_points(next_move.to):
-            if direction in cant_go:
-                continue
-            distance = next_move.distance + self.grid.heat_loss[position]
-            recent_directions = next_move.recent_directions[1:] + (direction,)
-            heappush(self.next_moves, Move(distance, next_move.to, position, recent_directions, last=next_move))
-        return next_move
+        start = grid.index(self.start)
+        # The crucible can set off along either axis.
+        for axis in (HORIZONTAL, VERTICAL):
+            distances[start * 2 + axis] = 0
+            buckets[0].append(start * 2 + axis)
+        queued = 2
+
+        distance = 0
+        while queued:
+            bucket = buckets[distance % bucket_count]
+            while bucket:
+                state = bucket.pop()
+                queued -= 1
+                if distances[state] != distance:
+                    # Already reached more cheaply.
+                    continue
+                cell, axis = state >> 1, state & 1
+                if cell == end:
+                    return distance, state, previous
+                y, x = divmod(cell, width)
+                if axis == HORIZONTAL:
+                    step, before, after, turned = width, y, height - 1 - y, VERTICAL
+                else:
+                    step, before, after, turned = 1, x, width - 1 - x, HORIZONTAL
+                for delta, room in ((step, after), (-step, before)):
+                    total = distance
+                    next_cell = cell
+                    for run in range(1, min(max_run, room) + 1):
+                        next_cell += delta
+                        total += heat_loss[next_cell]
+                        if run < min_run:
+                            continue
+                        next_state = next_cell * 2 + turned
+                        if total < distances[next_state]:
+                            distances[next_state] = total
+                            buckets[total % bucket_count].append(next_state)
+                            queued += 1
+                            if previous is not None:
+                                previous[next_state] = state
+            distance += 1
+        raise ValueError(f'no route from {self.start} to {self.end}')
 
     def find_path(self) -> int:
         """
-        Find the shortest path from the start to the end.
+        Find the least heat loss from the start to the end.
         """
-        while True:
-            match self._iterate():
-                case None:
-                    continue
-                case move:
-                    if move.to == self.end:
-                        return move.distance
-    
-    def move_history_str(self, move: Move) -> str:
+        distance, _, _ = self._search(track_route=False)
+        return distance
+
+    def find_route(self) -> tuple[int, list[Position]]:
         """
-        Return a string showing the path that led to this move.
+        Find the least heat loss from the start to the end, along with every cell on one such route.
         """
-        positions_and_directions = {}
-        while move:
-            positions_and_directions[move.to] = move.recent_directions[-1]
-            move = move.last
-        positions_and_directions[self.start] = 'S'
-        s = ''
-        for y in range(self.grid.height):
-            for x in range(self.grid.width):
-                direction = positions_and_directions.get(Position(x, y))
-                if direction is not None:
-                    s += str(direction)
-                else:
-                    s += " "
-            s += "\n" 
-        return s
\ No newline at end of file
+        distance, state, previous = self._search(track_route=True)
+        stops = []
+        while state != -1:
+            stops.append(state)
+            state = previous[state]
+        stops.reverse()
+        # Fill in the cells each run passed through on the way to its stop.
+        cells = [stops[0] >> 1]
+        for stop in stops[1:]:
+            cell = stop >> 1
+            step = 1 if stop & 1 == HORIZONTAL else self.grid.width
+            if cell < cells[-1]:
+                step = -step
+            cells.extend(range(cells[-1] + step, cell + step, step))
+        return distance, [self.grid.position(cell) for cell in cells]
+
+    def route_str(self, route: list[Position]) -> str:
+        """
+        Return a string showing the direction the crucible moved into each cell of a route.
+        """
+        directions = {route[0]: 'S'}
+        for from_, to in zip(route, route[1:]):
+            if to.x > from_.x:
+                directions[to] = str(Direction.RIGHT)
+            elif to.x < from_.x:
+                directions[to] = str(Direction.LEFT)
+            elif to.y > from_.y:
+                directions[to] = str(Direction.DOWN)
+            else:
+                directions[to] = str(Direction.UP)
+        return "\n".join(
+            "".join(directions.get(Position(x, y), " ") for x in range(self.grid.width))
+            for y in range(self.grid.height)
+        )
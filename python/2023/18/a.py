@@ -1,10 +1,12 @@
+from puzzle_input import PuzzleInput, takes_puzzle_input
+
 from .instruction import Instruction
 from .path import Path
 
 
-def a(input: str) -> str:
-    instructions = [Instruction.build_from_line(line) for line in input.splitlines()]
+@takes_puzzle_input
+def a(input: PuzzleInput) -> str:
     path = Path()
-    for i in instructions:
-        path.do(i)
-    return str(path.calculate_area())
\ No newline at end of file
+    for line in input.lines():
+        path.do(Instruction.build_from_line(line))
+    return str(path.calculate_area())
@@ -1,10 +1,11 @@
-from .instruction import Instruction
+from puzzle_input import PuzzleInput, takes_puzzle_input
+
+from .instruction import switched_steps
 from .path import Path
 
 
-def b(input: str) -> str:
-    instructions = [Instruction.build_from_line(line, mode='switched') for line in input.splitlines()]
+@takes_puzzle_input
+def b(input: PuzzleInput) -> str:
     path = Path()
-    for i in instructions:
-        path.do(i)
-    return str(path.calculate_area())
\ No newline at end of file
+    path.follow(switched_steps(input.lines()))
+    return str(path.calculate_area())
@@ -1,5 +1,6 @@
 from enum import StrEnum
-from typing import Literal
+from itertools import batched
+from typing import Iterable, Iterator, Literal
 from dataclasses import dataclass
 
 class Direction(StrEnum):
@@ -9,6 +10,10 @@ class Direction(StrEnum):
     RIGHT = "R"
 
 
+# The direction each final hex digit stands for in a switched instruction.
+SWITCHED_DIRECTIONS = (Direction.RIGHT, Direction.DOWN, Direction.LEFT, Direction.UP)
+
+
 class Color:
     def __init__(self, r: int, g: int, b: int):
         self.r = r
@@ -55,4 +60,18 @@ class Instruction:
                     direction = Direction.UP
             distance = int(color_string[0:-1], 16)
             return cls(direction, distance, color)
-        
\ No newline at end of file
+
+
+def switched_steps(lines: Iterable[str], batch_size: int = 4096) -> Iterator[tuple[Direction, int]]:
+    """
+    Decode the (direction, distance) hidden in each line's color code, a batch of lines at a time.
+
+    Each batch's six-digit codes are joined and decoded with one bytes.fromhex call; the three bytes
+    per code hold the distance in the top 20 bits and the direction code in the bottom 4.
+    """
+    for batch in batched(lines, batch_size):
+        # Lines end with "(#xxxxxx)".
+        codes = bytes.fromhex(''.join(line[-7:-1] for line in batch))
+        for i in range(0, len(codes), 3):
+            code = int.from_bytes(codes[i:i + 3])
+            yield SWITCHED_DIRECTIONS[code & 0xf], code >> 4
@@ -1,5 +1,8 @@
 from typing import NamedTuple
 
+# The order of a part's fields, which is also the order ranges appear in a Box.
+FIELDS = "xmas"
+
 
 class Part(NamedTuple):
     x: int
@@ -12,7 +15,7 @@ class Part(NamedTuple):
         line = line.removeprefix("{").removesuffix("}")
         parts = line.split(",")
         as_dict = {}
-        for key, part in zip("xmas", parts):
+        for key, part in zip(FIELDS, parts):
             part = part[2:]
             as_dict[key] = int(part)
-        return cls(**as_dict)
\ No newline at end of file
+        return cls(**as_dict)
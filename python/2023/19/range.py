@@ -1,4 +1,6 @@
 from dataclasses import dataclass
+from math import prod
+from typing import TypeAlias
 
 
 @dataclass
@@ -8,4 +10,18 @@ class Range:
     end: int
 
     def __len__(self) -> int:
-        return self.end - self.start + 1
\ No newline at end of file
+        return self.end - self.start + 1
+
+    def split(self, at: int) -> tuple['Range | None', 'Range | None']:
+        """Split into the values below `at` and the values from `at` up, either of which may be empty."""
+        below = Range(self.start, min(self.end, at - 1)) if self.start < at else None
+        above = Range(max(self.start, at), self.end) if self.end >= at else None
+        return below, above
+
+
+# A range for each of a part's fields, in x, m, a, s order.
+Box: TypeAlias = tuple[Range, Range, Range, Range]
+
+
+def volume(box: Box) -> int:
+    return prod(len(r) for r in box)
@@ -1,7 +1,12 @@
 from dataclasses import dataclass
-from typing import Literal
+from typing import Iterable, Literal
 
-from .part import Part
+from .part import FIELDS, Part
+from .range import Box, Range, volume
+
+# Where a decision tree ends up once a part is settled; real nodes have indexes from 0.
+ACCEPT = -1
+REJECT = -2
 
 
 @dataclass
@@ -27,6 +32,14 @@ class Test:
         else:
             return test_value < self.threshold
         
+    def split(self, r: Range) -> tuple[Range | None, Range | None]:
+        """Split a range of values into the ones that pass this test and the ones that fail it."""
+        if self.isGt:
+            failing, passing = r.split(self.threshold + 1)
+        else:
+            passing, failing = r.split(self.threshold)
+        return passing, failing
+
     @classmethod
     def build_from_str(cls, s: str) -> 'Test':
         field = s[0]
@@ -84,3 +97,76 @@ class Ruleset:
     
     def all_tests(self) -> list[Test]:
         return [test for rule in self.rules.values() for test in rule.tests]
+
+    def count_accepted(self, box: Box, rule_name: str = "in") -> int:
+        """
+        Count the parts in a box of field ranges that end up accepted.
+
+        Each test splits the box in two at its threshold, so the work grows with the number of
+        tests rather than the number of distinct combinations of values.
+        """
+        if rule_name == "A":
+            return volume(box)
+        if rule_name == "R":
+            return 0
+        rule = self.rules[rule_name]
+        accepted = 0
+        for test in rule.tests:
+            i = FIELDS.index(test.field)
+            passing, failing = test.split(box[i])
+            if passing is not None:
+                accepted += self.count_accepted(box[:i] + (passing,) + box[i + 1:], test.on_success)
+            if failing is None:
+                return accepted
+            box = box[:i] + (failing,) + box[i + 1:]
+        return accepted + self.count_accepted(box, rule.fallback)
+
+    def compile(self) -> 'DecisionTree':
+        # Every test gets a node, numbered rule by rule, so a rule starts at its first test's node.
+        first_node = {}
+        count = 0
+        for rule in self.rules.values():
+            first_node[rule.name] = count
+            count += len(rule.tests)
+
+        def destination(name: str) -> int:
+            while name not in ("A", "R") and not self.rules[name].tests:
+                name = self.rules[name].fallback
+            if name == "A":
+                return ACCEPT
+            if name == "R":
+                return REJECT
+            return first_node[name]
+
+        nodes = []
+        for rule in self.rules.values():
+            for i, test in enumerate(rule.tests):
+                passed = destination(test.on_success)
+                failed = first_node[rule.name] + i + 1 if i + 1 < len(rule.tests) else destination(rule.fallback)
+                field = FIELDS.index(test.field)
+                # Every node asks whether a field is above its threshold; v < t is the same as not v > t - 1.
+                if test.isGt:
+                    nodes.append((field, test.threshold, passed, failed))
+                else:
+                    nodes.append((field, test.threshold - 1, failed, passed))
+        return DecisionTree(nodes, destination("in"))
+
+
+@dataclass
+class DecisionTree:
+    """A ruleset flattened into one list of threshold tests, for routing lots of parts quickly."""
+    # Each node is (field index, threshold, next node if the field is above it, next node otherwise).
+    nodes: list[tuple[int, int, int, int]]
+    start: int
+
+    def route(self, part: Part) -> bool:
+        """Decides whether a part is accepted (true) or rejected (false)."""
+        nodes = self.nodes
+        node = self.start
+        while node >= 0:
+            field, threshold, above, otherwise = nodes[node]
+            node = above if part[field] > threshold else otherwise
+        return node == ACCEPT
+
+    def accepted(self, parts: Iterable[Part]) -> list[Part]:
+        return [part for part in parts if self.route(part)]
@@ -1,2 +1,6 @@
+from .mod import ModuleSet
+
+
 def b(input: str) -> str:
-    ...
\ No newline at end of file
+    mod = ModuleSet.build_from_str(input)
+    return str(mod.presses_until_low_pulse("rx"))
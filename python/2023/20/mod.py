@@ -1,155 +1,159 @@
-from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import NamedTuple
+from math import lcm
 
+# Module kinds, once compiled.
+BROADCASTER, FLIP_FLOP, CONJUNCTION, OUTPUT = range(4)
+KINDS = {"": BROADCASTER, "%": FLIP_FLOP, "&": CONJUNCTION}
 
-class Signal(NamedTuple):
-    high: bool
-    from_name: str
-    to_name: str
 
-    def __repr__(self) -> str:
-        return f"Signal({'HIGH' if self.high else 'LOW'}, {self.from_name} -> {self.to_name})"
-
-
-class Module(ABC):
+@dataclass
+class Module:
+    # "%" for a flip-flop, "&" for a conjunction, or "" for the broadcaster.
+    kind: str
+    name: str
+    destinations: list[str]
 
-    def __init__(self, name: str, destinations: list[str]):
-        self.name = name
-        self.destinations = destinations
-        self.low_pulses_sent = 0
-        self.high_pulses_sent = 0
-    
-    @staticmethod
-    def build_from_line(line: str):
+    @classmethod
+    def build_from_line(cls, line: str) -> 'Module':
         """
         Build a module from a line of input.
         """
-        kind = Broadcaster
-        match line[0]:
-            case "%":
-                kind = FlipFlopModule
-                line = line[1:]
-            case "&":
-                kind = InvertModule
-                line = line[1:]
-        name, destination_str = line.split(' -> ')
-        destinations = destination_str.split(', ')
-        return kind(name, destinations)
-
-    @abstractmethod
-    def receive(self, signal: Signal) -> list[Signal]:
-        """
-        Receive a signal from a source module.
-        
-        Returns a list of tuples, each indicating a signal to be sent onward, in the
-        form (destination_name, signal).
-        """
-        raise NotImplementedError
-    
-    def _send(self, high: bool) -> list[Signal]:
-        """
-        Create signals  to be sent to all destinations.
-
-        Signals are tuples of (destination_name, signal).
-        """
-        if high:
-            self.high_pulses_sent += len(self.destinations)
-        else:
-            self.low_pulses_sent += len(self.destinations)
-        signals = [Signal(high, self.name, destination) for destination in self.destinations]
-        return signals
-
-
-class Broadcaster(Module):
-
-    def __init__(self, name: str, destinations: list[str]):
-        super().__init__(name, destinations)
-    
-    def receive(self, signal: Signal) -> list[Signal]:
-        return self._send(signal.high)
-    
-
-class FlipFlopModule(Module):
-
-    def __init__(self, name: str, destinations: list[str]):
-        super().__init__(name, destinations)
-        self.on = False
-    
-    def receive(self, signal: Signal) -> list[Signal]:
-        if signal.high:
-            return []
-        else:
-            self.on = not self.on
-            return self._send(self.on)
-    
-    def __repr__(self) -> str:
-        return f"FlipFlopModule({self.name}, {self.destinations}, on={self.on})"
-
-
-class InvertModule(Module):
-
-    def __init__(self, name: str, destinations: list[str]):
-        super().__init__(name, destinations)
-        self.inputs: dict[str, bool] = {}
-    
-    def receive(self, signal: Signal) -> list[Signal]:
-        if len(self.inputs) == 0:
-            raise RuntimeError("Inputs must be set before receiving signals.")
-
-        self.inputs[signal.from_name] = signal.high
-        if all(self.inputs.values()):
-            return self._send(False)
-        else:
-            return self._send(True)
-    
-    def add_input(self, name: str):
-        self.inputs[name] = False
-    
-    def __repr__(self) -> str:
-        return f"InvertModule({self.name}, {self.destinations}, inputs={self.inputs})"
+        kind = line[0] if line[0] in "%&" else ""
+        name, destination_str = line.removeprefix(kind).split(' -> ')
+        return cls(kind, name, destination_str.split(', '))
 
 
-@dataclass
 class ModuleSet:
-    broadcaster: Broadcaster
-    modules: dict[str, Module]
-    low_signals_sent: int = 0
-    high_signals_sent: int = 0
-    button_presses: int = 0
+    """
+    A network of modules compiled down to integer ids.
+
+    Every connection is an edge, numbered so that each module's outgoing edges are contiguous, and a
+    pulse is a single int: edge * 2 + 1 for a high pulse or edge * 2 for a low one. A conjunction
+    remembers its inputs as a bitmask with one bit per incoming edge.
+    """
+
+    def __init__(self, modules: list[Module]):
+        self.names = [module.name for module in modules]
+        for module in modules:
+            for destination in module.destinations:
+                # Destinations like "rx" never send anything on, so they only appear here.
+                if destination not in self.names:
+                    self.names.append(destination)
+        self.ids = {name: i for i, name in enumerate(self.names)}
+        self.kinds = bytearray(KINDS[module.kind] for module in modules)
+        self.kinds.extend([OUTPUT] * (len(self.names) - len(modules)))
+
+        # The button is one more module, whose only edge leads to the broadcaster.
+        self.button = len(self.names)
+        outgoing = [[self.ids[d] for d in module.destinations] for module in modules]
+        outgoing.extend([[]] * (self.button - len(modules)))
+        outgoing.append([self.ids["broadcaster"]])
+
+        self.edge_starts = [0]
+        self.edge_destinations: list[int] = []
+        self.edge_bits: list[int] = []
+        self.inputs: list[list[int]] = [[] for _ in self.names]
+        for source, destinations in enumerate(outgoing):
+            for destination in destinations:
+                self.edge_bits.append(1 << len(self.inputs[destination]))
+                self.inputs[destination].append(source)
+                self.edge_destinations.append(destination)
+            self.edge_starts.append(len(self.edge_destinations))
+        # A conjunction sends a low pulse once every one of its bits is set.
+        self.all_high = [(1 << len(inputs)) - 1 for inputs in self.inputs]
+
+        self.flip_flops_on = bytearray(len(self.names))
+        self.memory = [0] * len(self.names)
+        self.low_signals_sent = 0
+        self.high_signals_sent = 0
+        self.button_presses = 0
 
     @classmethod
     def build_from_str(cls, s: str) -> 'ModuleSet':
-        lines = s.splitlines()
-        modules = [Module.build_from_line(line) for line in lines]
-        # Find the broadcaster and non-broadcaster modules.
-        broadcaster = [module for module in modules if isinstance(module, Broadcaster)][0]
-        other_modules = [module for module in modules if not isinstance(module, Broadcaster)]
-
-        # One last thing: InvertModules need to know their inputs. Figure those out.
-        inv_modules = [module for module in other_modules if isinstance(module, InvertModule)]
-        for inv_module in inv_modules:
-            for module in modules:
-                if inv_module.name in module.destinations:
-                    inv_module.add_input(module.name)
-        return cls(broadcaster, {module.name: module for module in other_modules})
-    
-    def press_button(self):
+        return cls([Module.build_from_line(line) for line in s.splitlines()])
+
+    def press_button(self) -> tuple[int, int]:
         """
-        Press the button on the broadcaster.
+        Press the button on the broadcaster and deliver every pulse that follows.
+
+        Returns two bitmasks over module ids: the modules that sent a high pulse, and the modules
+        that received a low pulse.
         """
-        # Send a low signal to the broadcaster.
         self.button_presses += 1
-        signals = self.broadcaster.receive(Signal(False, "", self.broadcaster.name))
-        while len(signals) > 0:
-            next_signals = []
-            for signal in signals:
-                module = self.modules.get(signal.to_name)
-                if module is None:
+        kinds, edge_starts, edge_destinations, edge_bits = self.kinds, self.edge_starts, self.edge_destinations, self.edge_bits
+        flip_flops_on, memory, all_high = self.flip_flops_on, self.memory, self.all_high
+        sent_high = received_low = 0
+        high_count = 0
+        # A list read from the front with an index, rather than popping, since it only lives for one press.
+        queue = [edge_starts[self.button] * 2]
+        head = 0
+        while head < len(queue):
+            pulse = queue[head]
+            head += 1
+            edge, high = pulse >> 1, pulse & 1
+            module = edge_destinations[edge]
+            if high:
+                high_count += 1
+            else:
+                received_low |= 1 << module
+            kind = kinds[module]
+            if kind == FLIP_FLOP:
+                if high:
                     continue
-                new_signals = module.receive(signal)
-                next_signals.extend(new_signals)
-            signals = next_signals
+                send = flip_flops_on[module] = 1 - flip_flops_on[module]
+            elif kind == CONJUNCTION:
+                if high:
+                    memory[module] |= edge_bits[edge]
+                else:
+                    memory[module] &= ~edge_bits[edge]
+                send = 0 if memory[module] == all_high[module] else 1
+            elif kind == BROADCASTER:
+                send = high
+            else:
+                continue
+            if send:
+                sent_high |= 1 << module
+            queue.extend(range(edge_starts[module] * 2 + send, edge_starts[module + 1] * 2, 2))
+        self.high_signals_sent += high_count
+        self.low_signals_sent += len(queue) - high_count
+        return sent_high, received_low
+
+    def presses_until_low_pulse(self, name: str = "rx", limit: int = 1_000_000) -> int:
+        """
+        Find the press on which the named module first receives a low pulse.
 
-        self.low_signals_sent = self.broadcaster.low_pulses_sent + sum(module.low_pulses_sent for module in self.modules.values()) + self.button_presses
-        self.high_signals_sent = sum(module.high_pulses_sent for module in self.modules.values())
\ No newline at end of file
+        When the module is fed by a single conjunction, that conjunction sends a low pulse only once
+        all its inputs have just sent it a high one. If each input does that on a regular cycle from
+        the start, the answer is the lcm of the cycles and the presses in between can be skipped.
+        Otherwise, fall back to pressing the button until it happens.
+        """
+        if name not in self.ids:
+            raise ValueError(f"there's no module named {name}")
+        target = self.ids[name]
+        feeders = self.inputs[target]
+        if len(feeders) == 1 and self.kinds[feeders[0]] == CONJUNCTION:
+            inputs = self.inputs[feeders[0]]
+            high_presses: dict[int, list[int]] = {module: [] for module in inputs}
+            while self.button_presses < limit:
+                sent_high, received_low = self.press_button()
+                if received_low >> target & 1:
+                    return self.button_presses
+                for module, presses in high_presses.items():
+                    if sent_high >> module & 1 and len(presses) < 2:
+                        presses.append(self.button_presses)
+                if all(len(presses) == 2 for presses in high_presses.values()):
+                    break
+            else:
+                raise ValueError(f"{name} got no low pulse within {limit} presses")
+            cycles = []
+            for module, (first, second) in high_presses.items():
+                if second - first != first:
+                    raise ValueError(f"{self.names[module]} doesn't send high pulses on a cycle from the start")
+                cycles.append(first)
+            return lcm(*cycles)
+
+        while self.button_presses < limit:
+            _, received_low = self.press_button()
+            if received_low >> target & 1:
+                return self.button_presses
+        raise ValueError(f"{name} got no low pulse within {limit} presses")
@@ -1,7 +1,10 @@
-from .parse import parse
+from puzzle_input import PuzzleInput, takes_puzzle_input
 
+from .parse import Game
 
-def a(input: str) -> str:
-    game = parse(input)
+
+@takes_puzzle_input
+def a(input: PuzzleInput) -> str:
+    game = Game.from_sections(input.sections())
     locations = game.get_final_translations()
     return str(min(locations))
\ No newline at end of file
@@ -1,14 +1,11 @@
-from .parse import parse
+from puzzle_input import PuzzleInput, takes_puzzle_input
 
+from .parse import Game
 
-def b(input: str) -> str:
-    game = parse(input, seeds_type='range')
-    # Start at the lowest destination range and test every point until finding one that can be translated backward.
-    dest_ranges = game.destination_ranges()
-    for dest in range(0, dest_ranges[-1][1] + 1):
-        if dest % 100_000 == 0:
-            print(f'Destination: {dest}')
-        source = game.backward_translate(dest)
-        if game.has_seed(source):
-            return str(dest)
-    return 'No solution found'
\ No newline at end of file
+
+@takes_puzzle_input
+def b(input: PuzzleInput) -> str:
+    game = Game.from_sections(input.sections(), seeds_type='range')
+    # Push whole seed ranges through the mappings; the answer is the lowest start of any resulting range.
+    locations = game.get_final_range_translations()
+    return str(min(start for start, _ in locations))
@@ -1,4 +1,6 @@
+from bisect import bisect_right
 from dataclasses import dataclass
+from typing import Iterable
 
 
 @dataclass
@@ -24,35 +26,52 @@ class MappingRange:
             return None
         return source + self.delta
     
-    def backward_translate(self, destination: int) -> int | None:
-        if destination < self.destination_start or destination > self.destination_end:
-            return None
-        return destination - self.delta
-    
     def __str__(self) -> str:
         return f'[{self.source_start}-{self.source_end}]  ({"+" if self.delta > 1 else ""}{self.delta})'
     
 
 @dataclass
 class Mapping:
+    # Sorted by source_start, and non-overlapping.
     ranges: list[MappingRange]
 
+    def __post_init__(self):
+        self.starts = [mapping_range.source_start for mapping_range in self.ranges]
+
     def translate(self, source: int) -> int:
-        # Search all the individual ranges for one that matches.
-        for mapping_range in self.ranges:
-            translation = mapping_range.translate(source)
+        # Only the last range starting at or before the source can contain it.
+        idx = bisect_right(self.starts, source) - 1
+        if idx >= 0:
+            translation = self.ranges[idx].translate(source)
             if translation is not None:
                 return translation
         return source
-    
-    def backward_translate(self, destination: int) -> int:
-        # Search all the individual ranges for one that matches.
-        for mapping_range in self.ranges:
-            translation = mapping_range.backward_translate(destination)
-            if translation is not None:
-                return translation
-        return destination
 
+    def translate_ranges(self, sources: list[tuple[int, int]]) -> list[tuple[int, int]]:
+        """Translate inclusive (start, end) ranges, splitting them wherever they cross a mapping range boundary."""
+        translations = []
+        for start, end in sources:
+            idx = max(bisect_right(self.starts, start) - 1, 0)
+            while start <= end:
+                if idx == len(self.ranges):
+                    # Past the last mapping range, everything maps to itself.
+                    translations.append((start, end))
+                    break
+                mapping_range = self.ranges[idx]
+                if start < mapping_range.source_start:
+                    # The gap before this mapping range maps to itself.
+                    piece_end = min(end, mapping_range.source_start - 1)
+                    translations.append((start, piece_end))
+                elif start <= mapping_range.source_end:
+                    piece_end = min(end, mapping_range.source_end)
+                    translations.append((start + mapping_range.delta, piece_end + mapping_range.delta))
+                    idx += 1
+                else:
+                    idx += 1
+                    continue
+                start = piece_end + 1
+        return translations
+    
     @classmethod
     def from_lines(cls, lines: list[str]) -> 'Mapping':
         ranges = sorted([MappingRange.from_line(line) for line in lines], key=lambda r: r.source_start)
@@ -62,13 +81,16 @@ class Mapping:
 @dataclass
 class Game:
     seeds: list[int] | list[(int, int)]
-    maps: list[list[MappingRange]]
+    maps: list[Mapping]
     seeds_type: str = 'list'
 
     @classmethod
     def from_str(cls, input: str, seeds_type: str = 'list') -> 'Game':
         input = input.strip()
-        sections = input.split('\n\n')
+        return cls.from_sections(input.split('\n\n'), seeds_type=seeds_type)
+
+    @classmethod
+    def from_sections(cls, sections: Iterable[str], seeds_type: str = 'list') -> 'Game':
         # The first line defines the seeds.
         seed_line, *sections = sections
         if seeds_type == 'list':
@@ -92,30 +114,12 @@ class Game:
             translations = [mapping.translate(translation) for translation in translations]
         return translations
     
-    def backward_translate(self, destination: int) -> int | None:
-        # Start with the destination
-        translation = destination
-        for mapping in reversed(self.maps):
-            translation = mapping.backward_translate(translation)
-            if translation is None:
-                return None
-        return translation
-    
-    def destination_ranges(self) -> list[(int, int)]:
-        ranges = []
-        for range in self.maps[-1].ranges:
-            ranges.append((range.destination_start, range.destination_end))
-        ranges = sorted(ranges, key=lambda r: r[0])
-        return ranges
-    
-    def has_seed(self, seed: int) -> bool:
-        if self.seeds_type == 'list':
-            return seed in self.seeds
-        else:
-            for start, end in self.seeds:
-                if seed >= start and seed <= end:
-                    return True
-    
+    def get_final_range_translations(self) -> list[tuple[int, int]]:
+        translations = self.seeds
+        for mapping in self.maps:
+            translations = mapping.translate_ranges(translations)
+        return translations
+
 
 def parse(input: str, seeds_type='list') -> Game:
     return Game.from_str(input, seeds_type=seeds_type)
\ No newline at end of file
@@ -1,5 +1,28 @@
+import math
 from dataclasses import dataclass
-from typing import Self
+from typing import Self, Sequence
+
+
+def ways_to_win(time: int, distance: int) -> int:
+    """Count the hold times h in [1, time) with h * (time - h) > distance."""
+    # The winning holds lie strictly between the roots of h^2 - time*h + distance = 0.
+    discriminant = time * time - 4 * distance
+    if discriminant <= 0:
+        return 0
+    # isqrt rounds down, so nudge the estimate onto the first hold that actually wins.
+    first = max((time - math.isqrt(discriminant)) // 2, 1)
+    while first < time and first * (time - first) <= distance:
+        first += 1
+    while first > 1 and (first - 1) * (time - first + 1) > distance:
+        first -= 1
+    # The winning holds are symmetric about time / 2.
+    last = time - first
+    return max(last - first + 1, 0)
+
+
+def ways_to_win_many(times: Sequence[int], distances: Sequence[int]) -> list[int]:
+    return [ways_to_win(time, distance) for time, distance in zip(times, distances)]
+
 
 @dataclass
 class Race:
@@ -19,15 +42,4 @@ class Race:
         return [cls(time, distance) for time, distance in zip(times, distances)]
     
     def ways_to_win(self) -> int:
-        ways = 0
-        found_way = False
-        for speed in range(1, self.distance - 1):
-            time_remaining = self.time - speed
-            if time_remaining * speed > self.distance:
-                found_way = True
-                ways += 1
-            else:
-                # If we've had some wins already but then failed, no future inputs will work.
-                if found_way:
-                    break
-        return ways
\ No newline at end of file
+        return ways_to_win(self.time, self.distance)
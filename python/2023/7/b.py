@@ -1,12 +1,10 @@
-from functools import cmp_to_key
-
 from .round import Round
 
 
 def b(input: str) -> str:
     rounds = [Round.build_from_line(line, jokers_wild=True) for line in input.splitlines()]
-    # Order the rounds by their type_score
-    sorted_rounds = sorted(rounds, key=cmp_to_key(Round.compare))
+    # Order the rounds by their type_score, then card by card.
+    sorted_rounds = sorted(rounds, key=lambda round: round.sort_key)
     winnings = 0
     for rank, round in enumerate(sorted_rounds, start=1):
         score = rank * round.bid
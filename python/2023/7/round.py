@@ -1,5 +1,5 @@
-from itertools import groupby
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Iterable
 
 
 def points(card: str, jokers_wild: bool = False) -> int:
@@ -12,47 +12,69 @@ def points(card: str, jokers_wild: bool = False) -> int:
         case _: return int(card)
 
 
+CARDS = '23456789TJQKA'
+# Each card's points as a hex digit, so a whole hand converts to a number in one go.
+HEX_POINTS = str.maketrans({card: f'{points(card):x}' for card in CARDS})
+JOKER_HEX_POINTS = str.maketrans({card: f'{points(card, jokers_wild=True):x}' for card in CARDS})
+
+
+def hand_type(hand: str, jokers_wild: bool = False) -> int:
+    if jokers_wild:
+        rest = hand.replace('J', '')
+        jokers = len(hand) - len(rest)
+    else:
+        rest, jokers = hand, 0
+    # Jokers always do best joining the card we already have the most of, so they never add a group.
+    # The number of distinct cards then pins down the type, up to the size of the biggest group.
+    distinct = set(rest)
+    match len(distinct):
+        case 0 | 1:
+            # Five of a kind
+            return 7
+        case 2:
+            most = max(map(rest.count, distinct)) + jokers
+            # Four of a kind, or a full house
+            return 6 if most == 4 else 5
+        case 3:
+            most = max(map(rest.count, distinct)) + jokers
+            # Three of a kind, or two pairs
+            return 4 if most == 3 else 3
+        case 4:
+            # One pair
+            return 2
+        case _:
+            # High card
+            return 1
+
+
+def sort_key(hand: str, jokers_wild: bool = False) -> int:
+    """Pack the hand type and then each card's points into 4-bit digits, so comparing keys compares hands."""
+    card_points = hand.translate(JOKER_HEX_POINTS if jokers_wild else HEX_POINTS)
+    return (hand_type(hand, jokers_wild) << 4 * len(hand)) | int(card_points, 16)
+
+
+def total_winnings(lines: Iterable[str], jokers_wild: bool = False) -> int:
+    """Rank hands straight from input lines, without building a Round for each."""
+    keyed_bids = []
+    for line in lines:
+        hand, bid = line.split()
+        keyed_bids.append((sort_key(hand, jokers_wild), int(bid)))
+    keyed_bids.sort()
+    return sum(rank * bid for rank, (_, bid) in enumerate(keyed_bids, start=1))
+
+
 @dataclass
 class Round:
     hand: list[str]
     bid: int
     jokers_wild: bool = False
+    sort_key: int = field(init=False, repr=False, compare=False)
 
-    def grouped_hand(self) -> list[tuple[str, int]]:
-        joker_count = self.hand.count('J')
-        remaining_hand = [card for card in self.hand if card != 'J']
-        if len(remaining_hand) == 0:
-            return [('J', joker_count)]
-        hand = sorted(remaining_hand, reverse=True)
-        grouped_hand = list((card, len(list(cards))) for (card, cards) in groupby(hand))
-        ordered_groups = sorted(grouped_hand, key=lambda x: x[1], reverse=True)
-        # Add all the jokes to the card we already have the most of.
-        updated_first_group = (ordered_groups[0][0], ordered_groups[0][1] + joker_count)
-        ordered_groups[0] = updated_first_group
-        return ordered_groups
+    def __post_init__(self):
+        self.sort_key = sort_key(''.join(self.hand), self.jokers_wild)
 
     def type_score(self) -> int:
-        grouped_hand = self.grouped_hand()
-        if grouped_hand[0][1] == 5:
-            # Five of a kind
-            return 7
-        if grouped_hand[0][1] == 4:
-            # Four of a kind
-            return 6
-        if grouped_hand[0][1] == 3 and grouped_hand[1][1] == 2:
-            # Full house
-            return 5
-        if grouped_hand[0][1] == 3:
-            # Three of a kind
-            return 4
-        if grouped_hand[0][1] == 2 and grouped_hand[1][1] == 2:
-            # Two pairs
-            return 3
-        if grouped_hand[0][1] == 2:
-            # One pair
-            return 2
-        # High card
-        return 1
+        return self.sort_key >> 20
     
     def wins_ties_over(self, other: 'Round') -> bool:
         for my_card, other_card in zip(self.hand, other.hand):
@@ -74,11 +96,6 @@ class Round:
     
     @staticmethod
     def compare(a: 'Round', b: 'Round') -> int:
-        a_tp_score = a.type_score()
-        b_tp_score = b.type_score()
-        if a_tp_score > b_tp_score:
-            return 1
-        elif a_tp_score < b_tp_score:
-            return -1
-        else:
-            return 1 if a.wins_ties_over(b) else -1
\ No newline at end of file
+        if a.sort_key == b.sort_key:
+            raise RuntimeError("Tie")
+        return 1 if a.sort_key > b.sort_key else -1
@@ -1,5 +1,9 @@
-from dataclasses import dataclass
+from array import array
+from dataclasses import dataclass, field
 from enum import StrEnum
+from functools import cached_property
+from itertools import product
+from math import gcd
 
 
 class Instruction(StrEnum):
@@ -9,10 +13,45 @@ class Instruction(StrEnum):
 
 @dataclass
 class RepeatInterval:
+    # The node at which the walk first re-enters a (node, instruction index) state it has seen.
     node: str
+    # The number of steps before the cycle starts (the tail length).
     first_idx: int
     repeat_length: int
+    # Every step within the tail and the first trip around the cycle at which the walk is on an end node.
     ending_node_idxs: list[int]
+    # The same steps as a set, for at_end.
+    ending_steps: set[int] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.ending_steps = set(self.ending_node_idxs)
+
+    def at_end(self, step: int) -> bool:
+        # Fold steps past the tail back onto the first trip around the cycle.
+        if step >= self.first_idx:
+            step = self.first_idx + (step - self.first_idx) % self.repeat_length
+        return step in self.ending_steps
+
+
+def crt(a1: int, m1: int, a2: int, m2: int) -> tuple[int, int] | None:
+    """Combine t = a1 (mod m1) and t = a2 (mod m2), for moduli that needn't be coprime."""
+    g = gcd(m1, m2)
+    if (a2 - a1) % g != 0:
+        return None
+    k = (a2 - a1) // g * pow(m1 // g, -1, m2 // g) % (m2 // g)
+    modulus = m1 // g * m2
+    return (a1 + m1 * k) % modulus, modulus
+
+
+@dataclass
+class CompiledGraph:
+    """The game's nodes as integer ids, so a step is just two array lookups."""
+    names: list[str]
+    # moves[0][node] is the left of node, moves[1][node] its right.
+    moves: tuple[array, array]
+    # 0 for L, 1 for R.
+    instructions: array
+    is_end: bytearray
 
 @dataclass
 class Node:
@@ -42,26 +81,38 @@ class Game:
         nodes = {node.name: node for node in node_list}
         return cls(instructions, nodes, end_node_type=end_node_type)
     
+    @cached_property
+    def graph(self) -> CompiledGraph:
+        names = list(self.nodes.keys())
+        ids = {name: idx for idx, name in enumerate(names)}
+        left = array('l', [ids[self.nodes[name].left] for name in names])
+        right = array('l', [ids[self.nodes[name].right] for name in names])
+        instructions = array('b', [0 if instruction == Instruction.L else 1 for instruction in self.instructions])
+        is_end = bytearray(self.at_end(name) for name in names)
+        return CompiledGraph(names, (left, right), instructions, is_end)
+
     def find_repeat_interval(self, node: str) -> RepeatInterval:
         # Play until we wind up back at the same node AND the same instruction index.
-        state = GameState(node, 0)
-        visited: dict[str, int] = {}
+        graph = self.graph
+        moves, instructions, is_end = graph.moves, graph.instructions, graph.is_end
+        n_instructions = len(instructions)
+        # The step at which each (node, instruction index) state was first seen, or -1.
+        visited = array('l', [-1]) * (len(graph.names) * n_instructions)
         ending_node_idxs = []
-        while state.node not in visited:
-            print(state.node)
-            visited[state.node] = state.instr_idx
-            instruction = self.instructions[state.instr_idx % len(self.instructions)]
-            if self.at_end(state.node):
-                ending_node_idxs.append(state.instr_idx)
-            match instruction:
-                case Instruction.R:
-                    state = GameState(self.nodes[state.node].right, state.instr_idx + 1)
-                case Instruction.L:
-                    state = GameState(self.nodes[state.node].left, state.instr_idx + 1)
-            print(state.node)
-        # Update the ending node indexes to be relative to the start of the loop.
-        ending_node_idxs = [idx - visited[state.node] for idx in ending_node_idxs]
-        return RepeatInterval(state.node, visited[state.node], state.instr_idx - visited[state.node], ending_node_idxs)
+        current = graph.names.index(node)
+        step = 0
+        instr_idx = 0
+        while visited[current * n_instructions + instr_idx] == -1:
+            visited[current * n_instructions + instr_idx] = step
+            if is_end[current]:
+                ending_node_idxs.append(step)
+            current = moves[instructions[instr_idx]][current]
+            step += 1
+            instr_idx += 1
+            if instr_idx == n_instructions:
+                instr_idx = 0
+        first_idx = visited[current * n_instructions + instr_idx]
+        return RepeatInterval(graph.names[current], first_idx, step - first_idx, ending_node_idxs)
 
     def play(self) -> int:
         return self.distance_to_end("AAA")
@@ -75,18 +126,36 @@ class Game:
     def ghost_play(self) -> int:
         # Find all nodes ending with A
         start_nodes = [name for name in self.nodes.keys() if name.endswith("A")]
-        state = GhostGameState(start_nodes, 0)
-        # Play until all nodes end with Z.
-        while not all(self.at_end(node) for node in state.nodes):
-            instruction = self.instructions[state.instr_idx % len(self.instructions)]
-            match instruction:
-                case Instruction.R:
-                    next_nodes = [self.nodes[node].right for node in state.nodes]
-                    state = GhostGameState(next_nodes, state.instr_idx + 1)
-                case Instruction.L:
-                    next_nodes = [self.nodes[node].left for node in state.nodes]
-                    state = GhostGameState(next_nodes, state.instr_idx + 1)
-        return state.instr_idx
+        intervals = [self.find_repeat_interval(node) for node in start_nodes]
+
+        # Before every ghost is inside its cycle, just check the steps directly.
+        longest_tail = max(interval.first_idx for interval in intervals)
+        for step in range(longest_tail):
+            if all(interval.at_end(step) for interval in intervals):
+                return step
+
+        # After that, each ghost is on an end node exactly when the step matches one of its cycle's end offsets.
+        cycle_offsets = [
+            [idx for idx in interval.ending_node_idxs if idx >= interval.first_idx]
+            for interval in intervals
+        ]
+        best = None
+        for offsets in product(*cycle_offsets):
+            combined = (0, 1)
+            for offset, interval in zip(offsets, intervals):
+                combined = crt(*combined, offset, interval.repeat_length)
+                if combined is None:
+                    break
+            if combined is None:
+                continue
+            remainder, modulus = combined
+            # The smallest matching step that is past every tail.
+            step = remainder + max(0, -(-(longest_tail - remainder) // modulus)) * modulus
+            if best is None or step < best:
+                best = step
+        if best is None:
+            raise RuntimeError("ghosts never all reach an end node together")
+        return best
     
     def distance_to_end(self, node: str) -> int:
         state = GameState(node, 0)
@@ -112,8 +181,3 @@ class Game:
 class GameState:
     node: str
     instr_idx: int
-
-@dataclass
-class GhostGameState:
-    nodes: list[str]
-    instr_idx: int
\ No newline at end of file
@@ -1,4 +1,30 @@
 from dataclasses import dataclass
+from functools import cache
+from math import comb, sumprod
+from typing import Sequence
+
+
+@cache
+def extrapolation_weights(n: int) -> tuple[tuple[int, ...], tuple[int, ...]]:
+    """
+    Weights that extrapolate n evenly spaced values one step forward and one step back.
+
+    Building difference rows until they're constant is the same as fitting the polynomial through
+    all n values, and Lagrange extrapolation of that polynomial to x = n or x = -1 has binomial weights.
+    """
+    next_weights = tuple((-1) ** (n - 1 - i) * comb(n, i) for i in range(n))
+    previous_weights = tuple((-1) ** i * comb(n, i + 1) for i in range(n))
+    return next_weights, previous_weights
+
+
+def extrapolate_many(rows: Sequence[Sequence[int]], backward: bool = False) -> list[int]:
+    """Extrapolate many equal-length histories at once, sharing one set of weights."""
+    if not rows:
+        return []
+    next_weights, previous_weights = extrapolation_weights(len(rows[0]))
+    weights = previous_weights if backward else next_weights
+    return [sumprod(weights, row) for row in rows]
+
 
 @dataclass
 class History:
@@ -10,43 +36,12 @@ class History:
         return cls(values)
     
     def find_next(self) -> int:
-        delta_lines = []
-        deltas = self.values
-        # Build out the deltas until they are all equal (the step before they're all 0).
-        while True:
-            deltas = [deltas[i] - deltas[i-1] for i in range(1, len(deltas))]
-            delta_lines.append(deltas)
-            deltas_are_all_equal = len(set(deltas)) == 1
-            if deltas_are_all_equal:
-                break
-        # Now work backwards to find the next value for each list of deltas.
-        while len(delta_lines) > 1:
-            deltas = delta_lines.pop()
-            # solve such that the next value of the previous deltas is offset from the previous by the last current delta.
-            next_value = delta_lines[-1][-1] + deltas[-1]
-            delta_lines[-1].append(next_value)
-        # Now we have just one list of deltas, and we can apply it to the main values sequence.
-        return self.values[-1] + delta_lines[0][-1]
+        next_weights, _ = extrapolation_weights(len(self.values))
+        return sumprod(next_weights, self.values)
     
     def find_previous(self) -> int:
-        delta_lines = []
-        deltas = self.values
-        # Build out the deltas until they are all equal (the step before they're all 0).
-        while True:
-            deltas = [deltas[i] - deltas[i-1] for i in range(1, len(deltas))]
-            delta_lines.append(deltas)
-            deltas_are_all_equal = len(set(deltas)) == 1
-            if deltas_are_all_equal:
-                break
-        # Now work backwards to find the next value for each list of deltas.
-        while len(delta_lines) > 1:
-            deltas = delta_lines.pop()
-            # solve such that the new first value of the previous deltas is offset from the previous by the first current delta.
-            prev_value = delta_lines[-1][0] - deltas[0]
-            # add to the front of the list
-            delta_lines[-1].insert(0, prev_value)
-        # Now we have just one list of deltas, and we can apply it to the main values sequence.
-        return self.values[0] - delta_lines[0][0]
+        _, previous_weights = extrapolation_weights(len(self.values))
+        return sumprod(previous_weights, self.values)
 
     def __str__(self):
-        return ' '.join(str(value) for value in self.values)
\ No newline at end of file
+        return ' '.join(str(value) for value in self.values)
@@ -1,4 +1,12 @@
-from .a import a
-from .b import b
+from importlib import import_module
 
 __all__ = ['a', 'b']
+
+
+def __getattr__(name: str):
+    # Import each part's solver on first use, so running part a never imports part b.
+    if name not in __all__:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    solver = getattr(import_module(f'.{name}', __name__), name)
+    globals()[name] = solver
+    return solver
@@ -1,20 +1,9 @@
-from collections import Counter
+from puzzle_input import PuzzleInput, takes_puzzle_input
 
-def b(input: str) -> str:
-    lines = input.splitlines()
-    column_a = []
-    column_b = []
-    for line in lines:
-        line = line.strip()
-        if len(line) == 0:
-            continue
-        a, b = line.split()
-        column_a.append(int(a))
-        column_b.append(int(b))
-    a = Counter(column_a)
-    b = Counter(column_b)
+from .location_lists import load_columns, similarity_score
 
-    running_sum = 0
-    for key in a:
-        running_sum += a[key] * b[key] * key
-    return str(running_sum)
\ No newline at end of file
+
+@takes_puzzle_input
+def b(input: PuzzleInput) -> str:
+    column_a, column_b = load_columns(input.buffer())
+    return str(similarity_score(column_a, column_b))
@@ -0,0 +1,34 @@
+from array import array
+from collections import Counter
+from operator import sub
+
+
+def load_columns(data: bytes | memoryview, chunk_size: int = 1 << 20) -> tuple[array, array]:
+    """
+    Parse the two whitespace-separated columns of location IDs in one pass over the raw input.
+
+    The input is split a chunk at a time, so a memory-mapped file is never copied whole.
+    """
+    numbers = array('q')
+    # A number cut off by the end of the previous chunk.
+    carry = b''
+    for start in range(0, len(data), chunk_size):
+        chunk = carry + data[start:start + chunk_size]
+        tokens = chunk.split()
+        carry = tokens.pop() if tokens and not chunk[-1:].isspace() else b''
+        numbers.extend(map(int, tokens))
+    if carry:
+        numbers.append(int(carry))
+    if len(numbers) % 2:
+        raise ValueError('the two lists have different lengths')
+    return numbers[::2], numbers[1::2]
+
+
+def total_distance(left: array, right: array) -> int:
+    """The sum of differences between the two lists when both are sorted, pairing smallest with smallest."""
+    return sum(map(abs, map(sub, sorted(left), sorted(right))))
+
+
+def similarity_score(left: array, right: array) -> int:
+    left_counts, right_counts = Counter(left), Counter(right)
+    return sum(id * count * right_counts[id] for id, count in left_counts.items())
@@ -0,0 +1,40 @@
+def _first_bad_step(numbers: list[int], direction: int, skip: int | None = None) -> int | None:
+    """
+    Find the first step that doesn't move 1-3 levels in the given direction, optionally treating the
+    level at index `skip` as removed.
+
+    Returns the index of the level the bad step starts from, or None if every step is fine.
+    """
+    previous = None
+    for i, number in enumerate(numbers):
+        if i == skip:
+            continue
+        if previous is not None and not 1 <= (number - numbers[previous]) * direction <= 3:
+            return previous
+        previous = i
+    return None
+
+
+def is_line_safe(line: str | list[int], try_removing: bool = False) -> bool:
+    if isinstance(line, str):
+        numbers = [int(n) for n in line.split(" ")]
+    else:
+        numbers = line
+    for direction in (1, -1):
+        bad = _first_bad_step(numbers, direction)
+        if bad is None:
+            return True
+        if not try_removing:
+            continue
+        # The bad step's two levels can't both stay, so removing one of them is the only possible fix.
+        # The step ends at the next level that wasn't skipped, which is always bad + 1 here.
+        if _first_bad_step(numbers, direction, skip=bad) is None:
+            return True
+        if _first_bad_step(numbers, direction, skip=bad + 1) is None:
+            return True
+    return False
+
+
+def count_safe(input: str, try_removing: bool = False) -> int:
+    """Count the safe reports in a whole input, one report per line."""
+    return sum(is_line_safe(line, try_removing) for line in input.splitlines() if line)
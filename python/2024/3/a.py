@@ -1,18 +1,8 @@
-import re
+from puzzle_input import PuzzleInput, takes_puzzle_input
 
-pattern = re.compile(r'mul\((\d+),(\d+)\)')
+from .memory import MemoryScanner
 
-def a(input: str) -> str:
-    input = input.strip()
-    pos = 0
-    sum = 0
-    while pos < len(input):
-        if match := pattern.match(input[pos:]):
-            a = int(match.group(1))
-            b = int(match.group(2))
-            sum += a * b
-            pos += match.span()[1]
-        else:
-            pos += 1
-        
-    return str(sum)
\ No newline at end of file
+
+@takes_puzzle_input
+def a(input: PuzzleInput) -> str:
+    return str(MemoryScanner().scan(input.buffer()))
@@ -0,0 +1,55 @@
+import re
+from typing import BinaryIO
+
+# Every instruction, as one alternation so a single pass finds them all in order.
+INSTRUCTION = re.compile(rb"mul\((\d+),(\d+)\)|(do)\(\)|(don't)\(\)")
+# A proper prefix of some instruction, right at the end of the buffer, which the next chunk might complete.
+PARTIAL_INSTRUCTION = re.compile(rb"(?:m(?:u(?:l(?:\((?:\d+(?:,\d*)?)?)?)?)?|d(?:o(?:\(|n(?:'(?:t\(?)?)?)?)?)\Z")
+
+
+class MemoryScanner:
+    """
+    Adds up the mul instructions in corrupted memory, fed either as one buffer or chunk by chunk.
+
+    With conditionals on, do() and don't() switch the mul instructions after them on and off.
+    """
+
+    def __init__(self, conditionals: bool = False):
+        self.conditionals = conditionals
+        self.enabled = True
+        self.total = 0
+        # The end of the last chunk, if it might be the start of an instruction.
+        self._tail = b''
+
+    def _run(self, buffer: bytes) -> int:
+        """Run every complete instruction in the buffer and return where the last one ended."""
+        end = 0
+        for match in INSTRUCTION.finditer(buffer):
+            left, right, do, dont = match.groups()
+            if do:
+                self.enabled = True
+            elif dont:
+                self.enabled = not self.conditionals
+            elif self.enabled:
+                self.total += int(left) * int(right)
+            end = match.end()
+        return end
+
+    def scan(self, buffer: bytes) -> int:
+        """Scan a whole buffer (bytes, or anything like it such as an mmap) and return the total so far."""
+        self._run(buffer)
+        return self.total
+
+    def feed(self, chunk: bytes) -> None:
+        """Scan the next chunk of a stream, holding back anything that could continue into the next one."""
+        buffer = self._tail + chunk
+        end = self._run(buffer)
+        partial = PARTIAL_INSTRUCTION.search(buffer, end)
+        self._tail = buffer[partial.start():] if partial else b''
+
+    def scan_stream(self, stream: BinaryIO, chunk_size: int = 1 << 20) -> int:
+        """Scan a binary stream in fixed-size chunks, so memory use doesn't grow with its length."""
+        while chunk := stream.read(chunk_size):
+            self.feed(chunk)
+        self._tail = b''
+        return self.total
@@ -1,19 +1,17 @@
-def b(input: str) -> str:
-    grid = [[c for c in line.strip()] for line in input.split()]
-    found = 0
-    for y in range(1, len(grid)-1):
-        for x in range(1, len(grid[0])-1):
-            if grid[y][x] == 'A':
-                has_pos_slope_mas = False
-                has_neg_slope_mas = False
-                if grid[y-1][x-1] == 'M' and grid[y+1][x+1] == 'S':
-                    has_pos_slope_mas = True
-                if grid[y-1][x-1] == 'S' and grid[y+1][x+1] == 'M':
-                    has_pos_slope_mas = True
-                if grid[y-1][x+1] == 'M' and grid[y+1][x-1] == 'S':
-                    has_neg_slope_mas = True
-                if grid[y-1][x+1] == 'S' and grid[y+1][x-1] == 'M':
-                    has_neg_slope_mas = True
-                if has_pos_slope_mas and has_neg_slope_mas:
-                    found += 1
-    return str(found)
+from puzzle_input import PuzzleInput, takes_puzzle_input
+
+from .word_search import WordSearch
+
+# An A with MAS running through it along both diagonals, in either direction. Each way of placing the
+# Ms and Ss is its own stencil, and no cell can match two of them.
+X_MAS_STENCILS = [
+    [(0, 0, 'A'), (-1, -1, top_left), (1, 1, bottom_right), (-1, 1, top_right), (1, -1, bottom_left)]
+    for top_left, bottom_right in (('M', 'S'), ('S', 'M'))
+    for top_right, bottom_left in (('M', 'S'), ('S', 'M'))
+]
+
+
+@takes_puzzle_input
+def b(input: PuzzleInput) -> str:
+    word_search = WordSearch(input.grid())
+    return str(sum(word_search.count_stencil(stencil) for stencil in X_MAS_STENCILS))
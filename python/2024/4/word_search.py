@@ -0,0 +1,59 @@
+from typing import TypeAlias
+
+from puzzle_input import Grid
+
+CHUNK_SIZE = 1 << 20
+
+# The eight directions a word can run in, as (dy, dx).
+DIRECTIONS = [(dy, dx) for dy in (-1, 0, 1) for dx in (-1, 0, 1) if (dy, dx) != (0, 0)]
+
+# Letters at offsets from an anchor cell, as (dy, dx, letter).
+Stencil: TypeAlias = list[tuple[int, int, str]]
+
+
+class WordSearch:
+    """
+    A letter grid that counts patterns across every cell at once.
+
+    Each letter gets a mask: one big int with a byte per cell, laid out like the grid's raw input, 1
+    where the letter is and 0 elsewhere (including the newlines). Shifting a mask by a cell offset lines
+    every cell up with its neighbour, so matching a stencil everywhere is a handful of shifts and ANDs.
+    """
+
+    def __init__(self, grid: Grid):
+        self.grid = grid
+        self.width = grid.width
+        self.stride = grid.stride
+        self.height = grid.height
+        self._masks: dict[str, int] = {}
+
+    def _mask(self, letter: str) -> int:
+        if letter not in self._masks:
+            table = bytes(int(byte == ord(letter)) for byte in range(256))
+            # A chunk at a time, so a memory-mapped grid is never copied whole.
+            data = memoryview(self.grid.data)
+            cells = b''.join(bytes(data[i:i + CHUNK_SIZE]).translate(table) for i in range(0, len(data), CHUNK_SIZE))
+            self._masks[letter] = int.from_bytes(cells, 'little')
+        return self._masks[letter]
+
+    def _columns(self, min_dx: int, max_dx: int) -> int:
+        """A mask of the cells whose row still has room for offsets from min_dx to max_dx."""
+        row = bytes(int(-min_dx <= x < self.width - max_dx) for x in range(self.stride))
+        return int.from_bytes(row * self.height, 'little')
+
+    def count_stencil(self, stencil: Stencil) -> int:
+        """Count the anchor cells where every letter of the stencil is in place."""
+        matches = self._columns(min(dx for _, dx, _ in stencil), max(dx for _, dx, _ in stencil))
+        for dy, dx, letter in stencil:
+            # Offsets past the top or bottom of the grid shift in zeros, so they never match.
+            shift = 8 * (dy * self.stride + dx)
+            mask = self._mask(letter)
+            matches &= mask >> shift if shift >= 0 else mask << -shift
+        return matches.bit_count()
+
+    def count_word(self, word: str) -> int:
+        """Count the times a word appears in a straight line, in any of the eight directions."""
+        return sum(
+            self.count_stencil([(i * dy, i * dx, letter) for i, letter in enumerate(word)])
+            for dy, dx in DIRECTIONS
+        )
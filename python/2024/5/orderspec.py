@@ -1,5 +1,7 @@
 from dataclasses import dataclass, field
-from collections import defaultdict
+from collections import Counter, defaultdict
+from functools import reduce
+from operator import or_
 
 @dataclass
 class PageOrderSpec:
@@ -10,8 +12,100 @@ class PageOrderSpec:
 class OrderSpec:
     pages: defaultdict[int, PageOrderSpec] = field(default_factory=lambda: defaultdict(PageOrderSpec))
 
+    @classmethod
+    def build_from_str(cls, input: str) -> 'OrderSpec':
+        spec = cls()
+        for line in input.split("\n"):
+            first, second = line.split("|")
+            first, second = int(first), int(second)
+            spec.pages[second].after.add(first)
+            spec.pages[first].before.add(second)
+        return spec
+
+    def compile(self) -> 'PrecedenceMatrix':
+        ids = {page: i for i, page in enumerate(self.pages)}
+        must_precede = [sum(1 << ids[other] for other in self.pages[page].before) for page in ids]
+        must_follow = [sum(1 << ids[other] for other in self.pages[page].after) for page in ids]
+        return PrecedenceMatrix(ids, must_precede, must_follow)
+
     def __repr__(self) -> str:
         s = ''
         for page, spec in self.pages.items():
             s += f'{page}: {spec}\n'
-        return s
\ No newline at end of file
+        return s
+
+
+@dataclass
+class PrecedenceMatrix:
+    """
+    An OrderSpec as a dense boolean matrix over page ids, with each row packed into an int.
+
+    Bit j of must_precede[i] is set when page i has to come before page j, and must_follow is its
+    transpose. Pages that no rule mentions are free to go anywhere.
+    """
+    ids: dict[int, int]
+    must_precede: list[int]
+    must_follow: list[int]
+
+    def _rows(self, numbers: list[int]) -> tuple[list[int], list[int], list[int]]:
+        """The id bit and both matrix rows for each page of an update."""
+        bits, precede, follow = [], [], []
+        for number in numbers:
+            i = self.ids.get(number)
+            bits.append(0 if i is None else 1 << i)
+            precede.append(0 if i is None else self.must_precede[i])
+            follow.append(0 if i is None else self.must_follow[i])
+        return bits, precede, follow
+
+    def validate(self, numbers: list[int]) -> bool:
+        # A page is out of order if it has to come before any page already printed.
+        seen = 0
+        for number in numbers:
+            i = self.ids.get(number)
+            if i is None:
+                continue
+            if self.must_precede[i] & seen:
+                return False
+            seen |= 1 << i
+        return True
+
+    def reorder(self, numbers: list[int]) -> list[int]:
+        """
+        Put an update's pages in an order that follows the rules, with Kahn's algorithm restricted to
+        those pages. When several pages are free to go next, the one that came first in the update goes.
+        A page listed more than once is placed once, with all its copies together.
+        """
+        copies = Counter(numbers)
+        pages = list(copies)
+        bits, precede, follow = self._rows(pages)
+        update = reduce(or_, bits, 0)
+        waiting_on = [(row & update).bit_count() for row in follow]
+        ready = [i for i, count in enumerate(waiting_on) if count == 0]
+        ordered = []
+        while ready:
+            ready.sort(reverse=True)
+            i = ready.pop()
+            ordered.extend([pages[i]] * copies[pages[i]])
+            for j, bit in enumerate(bits):
+                if precede[i] & bit:
+                    waiting_on[j] -= 1
+                    if waiting_on[j] == 0:
+                        ready.append(j)
+        if len(ordered) != len(numbers):
+            raise ValueError(f'the rules for {numbers} contain a cycle')
+        return ordered
+
+    def middle_page(self, numbers: list[int]) -> int:
+        """
+        The page that ends up in the middle once an update is reordered.
+
+        When the rules order every pair of the update's pages, each page's position is just how many
+        of them must come before it, so there's nothing to sort. That's the case exactly when those
+        counts are all different and run up to n - 1. Otherwise, fall back to reordering.
+        """
+        bits, _, follow = self._rows(numbers)
+        update = reduce(or_, bits, 0)
+        positions = [(row & update).bit_count() for row in follow]
+        if len(set(positions)) == len(numbers) and max(positions) == len(numbers) - 1:
+            return numbers[positions.index(len(numbers) // 2)]
+        return self.reorder(numbers)[len(numbers) // 2]
@@ -0,0 +1,217 @@
+import argparse
+import json
+import math
+import os
+import resource
+import statistics
+import sys
+import time
+import tracemalloc
+from contextlib import redirect_stdout
+from dataclasses import dataclass, field, asdict
+from multiprocessing import Pipe, Process
+from pathlib import Path
+
+from puzzle_input import solver_input
+from registry import PARTS, Registry, SolverEntry
+
+
+@dataclass
+class BenchResult:
+    year: str
+    day: str
+    part: str
+    status: str
+    times: list[float] = field(default_factory=list)
+    peak_rss: int | None = None
+    peak_alloc: int | None = None
+    answer: str | None = None
+    error: str | None = None
+
+    @property
+    def key(self) -> str:
+        return f'{self.year}/{self.day}/{self.part}'
+
+    @property
+    def min(self) -> float | None:
+        return min(self.times) if self.times else None
+
+    @property
+    def median(self) -> float | None:
+        return statistics.median(self.times) if self.times else None
+
+    @property
+    def p95(self) -> float | None:
+        if not self.times:
+            return None
+        # Nearest-rank percentile, so small sample counts still give a real observation.
+        ordered = sorted(self.times)
+        return ordered[math.ceil(0.95 * len(ordered)) - 1]
+
+    def to_dict(self) -> dict:
+        return asdict(self) | {'min': self.min, 'median': self.median, 'p95': self.p95}
+
+
+def _measure(entry: SolverEntry, input_path: Path, warmup: int, repeat: int, conn) -> None:
+    try:
+        # Solvers like to print progress; keep it out of the report.
+        with open(os.devnull, 'w') as devnull, redirect_stdout(devnull):
+            solver = entry.load()
+            contents = solver_input(solver, input_path)
+            for _ in range(warmup):
+                solver(contents)
+            times = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                answer = solver(contents)
+                times.append(time.perf_counter() - start)
+            # One extra traced run, kept out of the timings since tracemalloc slows everything down.
+            tracemalloc.start()
+            solver(contents)
+            _, peak_alloc = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+        # ru_maxrss is reported in KiB on Linux but bytes on macOS.
+        peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        if sys.platform != 'darwin':
+            peak_rss *= 1024
+        conn.send(('ok', times, peak_rss, peak_alloc, str(answer)))
+    except Exception as exc:
+        conn.send(('error', repr(exc)))
+    finally:
+        conn.close()
+
+
+def bench_one(entry: SolverEntry, input_path: Path, warmup: int, repeat: int, timeout: float) -> BenchResult:
+    # Each solver runs in its own process so a hung solver can be killed and RSS isn't shared.
+    receiver, sender = Pipe(duplex=False)
+    process = Process(target=_measure, args=(entry, input_path, warmup, repeat, sender))
+    process.start()
+    sender.close()
+    if not receiver.poll(timeout):
+        process.terminate()
+        process.join()
+        return BenchResult(entry.year, entry.day, entry.part, 'timeout')
+    try:
+        message = receiver.recv()
+    except EOFError:
+        message = ('error', f'worker exited with code {process.exitcode}')
+    process.join()
+    if message[0] == 'error':
+        return BenchResult(entry.year, entry.day, entry.part, 'error', error=message[1])
+    _, times, peak_rss, peak_alloc, answer = message
+    return BenchResult(entry.year, entry.day, entry.part, 'ok', times, peak_rss, peak_alloc, answer)
+
+
+def compare(results: list[BenchResult], baseline: dict[str, dict], threshold: float) -> dict[str, str]:
+    """Describe how each result moved relative to the baseline, flagging regressions with a leading '!'."""
+    notes = {}
+    for result in results:
+        previous = baseline.get(result.key)
+        if previous is None:
+            notes[result.key] = 'new'
+            continue
+        if previous['status'] == 'ok' and result.status != 'ok':
+            notes[result.key] = f'! {result.status}'
+        elif result.status != 'ok':
+            notes[result.key] = ''
+        elif previous['status'] != 'ok':
+            notes[result.key] = f'was {previous["status"]}'
+        elif previous['answer'] != result.answer:
+            notes[result.key] = f'! answer {previous["answer"]} -> {result.answer}'
+        else:
+            ratio = result.median / previous['median']
+            flag = '! ' if ratio > 1 + threshold else ''
+            notes[result.key] = f'{flag}{ratio:.2f}x'
+    return notes
+
+
+def _format_time(seconds: float | None) -> str:
+    if seconds is None:
+        return '-'
+    if seconds < 1e-3:
+        return f'{seconds * 1e6:.0f}us'
+    if seconds < 1:
+        return f'{seconds * 1e3:.1f}ms'
+    return f'{seconds:.2f}s'
+
+
+def _format_bytes(n: int | None) -> str:
+    if n is None:
+        return '-'
+    for unit in ['B', 'KiB', 'MiB']:
+        if n < 1024:
+            return f'{n:.0f}{unit}'
+        n /= 1024
+    return f'{n:.1f}GiB'
+
+
+def format_table(results: list[BenchResult], notes: dict[str, str] | None = None) -> str:
+    header = ['solver', 'status', 'min', 'median', 'p95', 'peak rss', 'peak alloc']
+    if notes is not None:
+        header.append('vs baseline')
+    rows = [header]
+    for result in results:
+        row = [
+            result.key,
+            result.status,
+            _format_time(result.min),
+            _format_time(result.median),
+            _format_time(result.p95),
+            _format_bytes(result.peak_rss),
+            _format_bytes(result.peak_alloc),
+        ]
+        if notes is not None:
+            row.append(notes.get(result.key, ''))
+        rows.append(row)
+    widths = [max(len(row[i]) for row in rows) for i in range(len(header))]
+    lines = ['  '.join(cell.ljust(width) for cell, width in zip(row, widths)).rstrip() for row in rows]
+    lines.insert(1, '  '.join('-' * width for width in widths))
+    return '\n'.join(lines)
+
+
+parser = argparse.ArgumentParser(prog='main.py bench', description='Time every solver against its input.')
+parser.add_argument('--year', type=str, action='append', help='only these years (repeatable)')
+parser.add_argument('--day', type=str, action='append', help='only these days (repeatable)')
+parser.add_argument('--part', type=str, choices=PARTS, action='append', help='only these parts (repeatable)')
+parser.add_argument('--test', action='store_true', help='use test_input.txt instead of input.txt')
+parser.add_argument('--warmup', type=int, default=1)
+parser.add_argument('--repeat', type=int, default=5)
+parser.add_argument('--timeout', type=float, default=60.0, help='seconds allowed per solver, across all runs')
+parser.add_argument('--json', type=str, help='write results as JSON to this file ("-" for stdout)')
+parser.add_argument('--baseline', type=str, help='compare against a JSON file written by --save-baseline')
+parser.add_argument('--save-baseline', type=str, help='write results as a new baseline file')
+parser.add_argument('--threshold', type=float, default=0.10, help='median slowdown counted as a regression')
+
+
+def main(argv: list[str]) -> int:
+    args = parser.parse_args(argv)
+    filename = 'test_input.txt' if args.test else 'input.txt'
+
+    results = []
+    for entry in Registry.load().select(years=args.year, days=args.day, parts=args.part):
+        input_path = entry.input_path(filename)
+        if not input_path.exists():
+            continue
+        result = bench_one(entry, input_path, args.warmup, args.repeat, args.timeout)
+        print(f'{result.key}: {result.status} {_format_time(result.median)}', file=sys.stderr)
+        results.append(result)
+
+    notes = None
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text())
+        notes = compare(results, baseline, args.threshold)
+    print(format_table(results, notes))
+
+    report = {result.key: result.to_dict() for result in results}
+    if args.json == '-':
+        print(json.dumps(report, indent=2))
+    elif args.json:
+        Path(args.json).write_text(json.dumps(report, indent=2))
+    if args.save_baseline:
+        Path(args.save_baseline).write_text(json.dumps(report, indent=2))
+
+    regressions = [key for key, note in (notes or {}).items() if note.startswith('!')]
+    if regressions:
+        print(f'Regressions: {", ".join(regressions)}', file=sys.stderr)
+        return 1
+    return 0
@@ -1,6 +1,10 @@
 import argparse
+import sys
 from pathlib import Path
 
+import registry
+from puzzle_input import solver_input
+
 YEARS = ['2023', '2024', '2025']
 PARTS = ['a', 'b']
 
@@ -10,6 +14,14 @@ python main.py 2023 1 a --test
 If --test is passed, the input file will be test_input.txt
 Custom input files can also be passed, like so:
 python main.py 2023 1 a --file custom_input.txt
+To time every solver against its input (see python main.py bench --help):
+python main.py bench --repeat 5 --save-baseline baseline.json
+python main.py bench --baseline baseline.json
+To run many solvers at once, with cached results (see python main.py run-all --help):
+python main.py run-all 2023 --days 1-10
+To list solvers, optionally with their import cost, or to save a manifest for faster lookups:
+python main.py list --import-time
+python main.py list --write-manifest
 """
 
 parser = argparse.ArgumentParser()
@@ -20,6 +32,15 @@ parser.add_argument("--test", action="store_true")
 parser.add_argument("--file", type=str)
 
 if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == 'bench':
+        import bench
+        sys.exit(bench.main(sys.argv[2:]))
+    if len(sys.argv) > 1 and sys.argv[1] == 'run-all':
+        import run_all
+        sys.exit(run_all.main(sys.argv[2:]))
+    if len(sys.argv) > 1 and sys.argv[1] == 'list':
+        sys.exit(registry.main(sys.argv[2:]))
+
     args = parser.parse_args()
     year = args.year
     day = args.day
@@ -43,17 +64,13 @@ if __name__ == "__main__":
     filepath = Path('../inputs') / year / day / part / filename
     if not filepath.exists():
         raise ValueError(f"file {filepath} does not exist")
-    contents = filepath.read_text()
     
-    # Try to magically import the correct module
+    # Look up the solver; only the module for this part gets imported.
     try:
-        module = __import__(f'{year}.{day}', fromlist=[part])
-    except ModuleNotFoundError:
+        solver = registry.Registry.load().get(year, day, part).load()
+    except KeyError:
         raise ValueError(f"no module {year}.{day} found")
-    if part == 'a':
-        result = module.a(contents)
-    else:
-        result = module.b(contents)
+    result = solver(solver_input(solver, filepath))
     print(f'Result: {result}')
     
     print(f'running year {year}, day {day}, part {part}, with input file {filename}')
@@ -0,0 +1,108 @@
+import io
+import mmap
+from functools import cached_property
+from pathlib import Path
+from typing import Callable, Iterator
+
+
+class Grid:
+    """A rectangular character grid over raw input bytes, indexed as grid[y, x] without copying any rows."""
+
+    def __init__(self, data: bytes | mmap.mmap):
+        self.data = data
+        newline = data.find(b'\n')
+        self.width = len(data) if newline == -1 else newline
+        # Each row is followed by a newline, except possibly the last.
+        self.stride = self.width + 1
+        self.height = (len(data) + 1) // self.stride if data else 0
+
+    def __getitem__(self, position: tuple[int, int]) -> int:
+        y, x = position
+        if not (0 <= y < self.height and 0 <= x < self.width):
+            raise IndexError(f'{position} is outside the grid')
+        return self.data[y * self.stride + x]
+
+    def row(self, y: int) -> memoryview:
+        start = y * self.stride
+        return memoryview(self.data)[start:start + self.width]
+
+    def find(self, char: bytes) -> tuple[int, int] | None:
+        offset = self.data.find(char)
+        if offset == -1:
+            return None
+        return divmod(offset, self.stride)
+
+
+class PuzzleInput:
+    """
+    A puzzle input that solvers can read in whichever shape suits them, without holding extra copies.
+
+    Solvers opt in with @takes_puzzle_input; everything else still receives the input as one str.
+    """
+
+    def __init__(self, path: Path | None = None, data: bytes | None = None):
+        if (path is None) == (data is None):
+            raise ValueError('pass exactly one of path or data')
+        self.path = path
+        self._data = data
+
+    @classmethod
+    def from_str(cls, text: str) -> 'PuzzleInput':
+        return cls(data=text.encode())
+
+    @cached_property
+    def _mapped(self) -> bytes | mmap.mmap:
+        if self._data is not None:
+            return self._data
+        with open(self.path, 'rb') as f:
+            # mmap refuses empty files.
+            if f.seek(0, io.SEEK_END) == 0:
+                return b''
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def _open(self) -> io.TextIOBase:
+        if self._data is not None:
+            return io.TextIOWrapper(io.BytesIO(self._data))
+        return open(self.path)
+
+    def text(self) -> str:
+        with self._open() as f:
+            return f.read()
+
+    def buffer(self) -> memoryview:
+        """The raw bytes of the input, memory-mapped when read from a file."""
+        return memoryview(self._mapped)
+
+    def grid(self) -> Grid:
+        return Grid(self._mapped)
+
+    def lines(self) -> Iterator[str]:
+        """Stream the lines of the input, without trailing newlines."""
+        with self._open() as f:
+            for line in f:
+                yield line.rstrip('\n')
+
+    def sections(self) -> Iterator[str]:
+        """Stream the blank-line-separated sections of the input, one at a time."""
+        section: list[str] = []
+        for line in self.lines():
+            if line:
+                section.append(line)
+            elif section:
+                yield '\n'.join(section)
+                section = []
+        if section:
+            yield '\n'.join(section)
+
+
+def takes_puzzle_input(solver: Callable[[PuzzleInput], str]) -> Callable[[PuzzleInput], str]:
+    """Mark a solver as taking a PuzzleInput rather than the whole input as a str."""
+    solver.takes_puzzle_input = True
+    return solver
+
+
+def solver_input(solver: Callable, path: Path) -> str | PuzzleInput:
+    """Build the argument a solver expects for the input file at path."""
+    if getattr(solver, 'takes_puzzle_input', False):
+        return PuzzleInput(path)
+    return path.read_text()
@@ -0,0 +1,158 @@
+import argparse
+import json
+import sys
+from dataclasses import dataclass, asdict
+from importlib import import_module
+from pathlib import Path
+from typing import Callable
+
+PYTHON_DIR = Path(__file__).resolve().parent
+INPUTS_DIR = PYTHON_DIR.parent / 'inputs'
+MANIFEST_PATH = PYTHON_DIR / '.cache' / 'manifest.json'
+PARTS = ['a', 'b']
+
+
+@dataclass(frozen=True)
+class SolverEntry:
+    year: str
+    day: str
+    part: str
+    module: str
+    function: str
+
+    @property
+    def key(self) -> str:
+        return f'{self.year}/{self.day}/{self.part}'
+
+    def input_path(self, filename: str = 'input.txt') -> Path:
+        return INPUTS_DIR / self.year / self.day / self.part / filename
+
+    def load(self) -> Callable[[str], str]:
+        """Import the solver's own module (and nothing for the other part) and return its entry point."""
+        return getattr(import_module(self.module), self.function)
+
+    def import_time(self) -> int:
+        """Cumulative import time of the solver module in microseconds, measured in a fresh interpreter."""
+        import subprocess
+        # -X importtime only reports imports made through __import__, not importlib.import_module.
+        completed = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', f'__import__({self.module!r})'],
+            cwd=PYTHON_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        # Lines look like "import time:   self [us] | cumulative | imported package".
+        for line in completed.stderr.splitlines():
+            if not line.startswith('import time:'):
+                continue
+            _, self_us, cumulative_us, name = [field.strip() for field in line.replace(':', '|', 1).split('|')]
+            if name == self.module:
+                return int(cumulative_us)
+        raise RuntimeError(f'no import time reported for {self.module}')
+
+
+def manifest_is_current(path: Path = MANIFEST_PATH) -> bool:
+    """
+    Whether the manifest was written after the last change to the set of solvers.
+
+    Adding a year, day or part file touches the directory that holds it, so it's enough to compare
+    the manifest against the mtimes of the python directory and every year and day directory.
+    """
+    if not path.exists():
+        return False
+    written = path.stat().st_mtime
+    directories = [PYTHON_DIR]
+    for year_dir in PYTHON_DIR.iterdir():
+        if year_dir.name.isdigit():
+            directories.append(year_dir)
+            directories.extend(day_dir for day_dir in year_dir.iterdir() if day_dir.is_dir())
+    return all(directory.stat().st_mtime <= written for directory in directories)
+
+
+class Registry:
+    """Maps (year, day, part) to a solver entry point without importing any solver."""
+
+    def __init__(self, entries: list[SolverEntry]):
+        self.entries = {entry.key: entry for entry in entries}
+
+    @classmethod
+    def scan(cls) -> 'Registry':
+        entries = []
+        for year_dir in PYTHON_DIR.iterdir():
+            if not year_dir.name.isdigit():
+                continue
+            for day_dir in year_dir.iterdir():
+                if not (day_dir / '__init__.py').exists():
+                    continue
+                for part in PARTS:
+                    if (day_dir / f'{part}.py').exists():
+                        year, day = year_dir.name, day_dir.name
+                        entries.append(SolverEntry(year, day, part, f'{year}.{day}.{part}', part))
+        return cls(entries)
+
+    @classmethod
+    def from_manifest(cls, path: Path = MANIFEST_PATH) -> 'Registry':
+        return cls([SolverEntry(**entry) for entry in json.loads(path.read_text())])
+
+    @classmethod
+    def load(cls, path: Path = MANIFEST_PATH) -> 'Registry':
+        # The manifest saves walking the tree; without a current one, scanning is still cheap.
+        if manifest_is_current(path):
+            return cls.from_manifest(path)
+        return cls.scan()
+
+    def write_manifest(self, path: Path = MANIFEST_PATH) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps([asdict(entry) for entry in self.select()], indent=2))
+
+    def get(self, year: str, day: str, part: str) -> SolverEntry:
+        key = f'{year}/{day}/{part}'
+        if key not in self.entries:
+            # The manifest may predate this solver.
+            self.entries = Registry.scan().entries
+        return self.entries[key]
+
+    def select(
+        self,
+        years: list[str] | None = None,
+        days: list[str] | set[str] | None = None,
+        parts: list[str] | None = None,
+    ) -> list[SolverEntry]:
+        selected = [
+            entry for entry in self.entries.values()
+            if (years is None or entry.year in years)
+            and (days is None or entry.day in days)
+            and (parts is None or entry.part in parts)
+        ]
+        return sorted(selected, key=lambda entry: (int(entry.year), int(entry.day), entry.part))
+
+
+parser = argparse.ArgumentParser(
+    prog='main.py list',
+    description='List the available solvers.',
+    epilog=(
+        'Solvers are found from the saved manifest when it exists and is newer than every year and day '
+        'directory; otherwise (for example after adding a day) the tree is rescanned, and the manifest is '
+        'only rewritten by --write-manifest.'
+    ),
+)
+parser.add_argument('--year', type=str, action='append', help='only these years (repeatable)')
+parser.add_argument('--import-time', action='store_true', help='measure each solver\'s import cost')
+parser.add_argument('--write-manifest', action='store_true', help=f'rescan and save the manifest to {MANIFEST_PATH}')
+
+
+def main(argv: list[str]) -> int:
+    args = parser.parse_args(argv)
+    if args.write_manifest:
+        registry = Registry.scan()
+        registry.write_manifest()
+    else:
+        registry = Registry.load()
+
+    for entry in registry.select(years=args.year):
+        if args.import_time:
+            print(f'{entry.key:<10} {entry.module:<12} {entry.import_time() / 1000:8.1f}ms')
+        else:
+            print(f'{entry.key:<10} {entry.module}')
+    return 0
@@ -0,0 +1,209 @@
+import argparse
+import ast
+import hashlib
+import json
+import os
+import signal
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import redirect_stdout
+from dataclasses import dataclass
+from pathlib import Path
+
+from puzzle_input import solver_input
+from registry import PARTS, PYTHON_DIR, Registry, SolverEntry
+
+DEFAULT_CACHE_DIR = PYTHON_DIR / '.cache' / 'results'
+
+
+@dataclass
+class Task:
+    entry: SolverEntry
+    input_path: Path
+
+    @property
+    def year(self) -> str:
+        return self.entry.year
+
+    @property
+    def day(self) -> str:
+        return self.entry.day
+
+    @property
+    def part(self) -> str:
+        return self.entry.part
+
+    @property
+    def key(self) -> str:
+        return self.entry.key
+
+
+@dataclass
+class TaskResult:
+    task: Task
+    status: str
+    answer: str | None = None
+    seconds: float | None = None
+    cached: bool = False
+
+
+def parse_days(spec: str) -> set[str]:
+    """Parse a day selection like '1-5,8,10-12'."""
+    days = set()
+    for chunk in spec.split(','):
+        if '-' in chunk:
+            start, end = chunk.split('-')
+            days.update(str(day) for day in range(int(start), int(end) + 1))
+        else:
+            days.add(str(int(chunk)))
+    return days
+
+
+def shared_modules(paths: list[Path]) -> set[Path]:
+    """The top-level modules in the python directory (like puzzle_input.py) that these files import, directly or not."""
+    found: set[Path] = set()
+    pending = list(paths)
+    while pending:
+        tree = ast.parse(pending.pop().read_bytes())
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                names = [alias.name for alias in node.names]
+            elif isinstance(node, ast.ImportFrom) and node.level == 0 and node.module:
+                names = [node.module]
+            else:
+                continue
+            for name in names:
+                path = PYTHON_DIR / f'{name.split(".")[0]}.py'
+                if path.exists() and path not in found:
+                    found.add(path)
+                    pending.append(path)
+    return found
+
+
+def source_hash(year: str, day: str) -> str:
+    # Hash every module in the day's package, since a.py and b.py share helpers, plus any shared
+    # top-level module they import, so edits to either invalidate cached answers.
+    day_paths = sorted((PYTHON_DIR / year / day).glob('*.py'))
+    digest = hashlib.sha256()
+    for path in day_paths + sorted(shared_modules(day_paths)):
+        digest.update(str(path.relative_to(PYTHON_DIR)).encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def input_hash(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+class ResultCache:
+    """Solver answers on disk, keyed by solver and input content so edits to either invalidate them."""
+
+    def __init__(self, directory: Path):
+        self.directory = directory
+        self._source_hashes: dict[tuple[str, str], str] = {}
+        self._input_hashes: dict[Path, str] = {}
+
+    def _path(self, task: Task) -> Path:
+        if (task.year, task.day) not in self._source_hashes:
+            self._source_hashes[(task.year, task.day)] = source_hash(task.year, task.day)
+        if task.input_path not in self._input_hashes:
+            self._input_hashes[task.input_path] = input_hash(task.input_path)
+        digest = hashlib.sha256()
+        for part in (task.year, task.day, task.part, self._input_hashes[task.input_path], self._source_hashes[(task.year, task.day)]):
+            digest.update(part.encode())
+            digest.update(b'\0')
+        return self.directory / task.year / task.day / f'{task.part}-{digest.hexdigest()}.json'
+
+    def get(self, task: Task) -> TaskResult | None:
+        path = self._path(task)
+        if not path.exists():
+            return None
+        entry = json.loads(path.read_text())
+        return TaskResult(task, 'ok', entry['answer'], entry['seconds'], cached=True)
+
+    def put(self, result: TaskResult) -> None:
+        path = self._path(result.task)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({'answer': result.answer, 'seconds': result.seconds}))
+
+
+def _on_alarm(signum, frame):
+    raise TimeoutError
+
+
+def _solve(entry: SolverEntry, input_path: Path, timeout: float) -> tuple[str, str | None, float | None]:
+    # Pool workers are reused, so the timeout is enforced in-process rather than by killing the worker.
+    signal.signal(signal.SIGALRM, _on_alarm)
+    signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        with open(os.devnull, 'w') as devnull, redirect_stdout(devnull):
+            solver = entry.load()
+            contents = solver_input(solver, input_path)
+            start = time.perf_counter()
+            answer = solver(contents)
+            seconds = time.perf_counter() - start
+    except TimeoutError:
+        return 'timeout', None, None
+    except Exception as exc:
+        return 'error', repr(exc), None
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+    return 'ok', str(answer), seconds
+
+
+def run_tasks(tasks: list[Task], timeout: float, workers: int | None = None, cache: ResultCache | None = None) -> list[TaskResult]:
+    results: dict[str, TaskResult] = {}
+    pending = []
+    for task in tasks:
+        cached = cache.get(task) if cache is not None else None
+        if cached is not None:
+            results[task.key] = cached
+        else:
+            pending.append(task)
+
+    if pending:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(_solve, task.entry, task.input_path, timeout): task
+                for task in pending
+            }
+            for future in as_completed(futures):
+                task = futures[future]
+                status, answer, seconds = future.result()
+                result = TaskResult(task, status, answer, seconds)
+                if cache is not None and status == 'ok':
+                    cache.put(result)
+                results[task.key] = result
+    return [results[task.key] for task in tasks]
+
+
+parser = argparse.ArgumentParser(prog='main.py run-all', description='Run many solvers at once in a process pool.')
+parser.add_argument('years', type=str, nargs='+')
+parser.add_argument('--days', type=str, help="days to run, like '1-5,8' (default: all)")
+parser.add_argument('--part', type=str, choices=PARTS, action='append', help='only these parts (repeatable)')
+parser.add_argument('--test', action='store_true', help='use test_input.txt instead of input.txt')
+parser.add_argument('--timeout', type=float, default=60.0, help='seconds allowed per solver')
+parser.add_argument('--workers', type=int, help='pool size (default: one per CPU)')
+parser.add_argument('--cache-dir', type=str, default=str(DEFAULT_CACHE_DIR))
+parser.add_argument('--no-cache', action='store_true')
+
+
+def main(argv: list[str]) -> int:
+    args = parser.parse_args(argv)
+    filename = 'test_input.txt' if args.test else 'input.txt'
+    days = parse_days(args.days) if args.days else None
+
+    tasks = []
+    for entry in Registry.load().select(years=args.years, days=days, parts=args.part):
+        input_path = entry.input_path(filename)
+        if input_path.exists():
+            tasks.append(Task(entry, input_path))
+
+    cache = None if args.no_cache else ResultCache(Path(args.cache_dir))
+    results = run_tasks(tasks, args.timeout, args.workers, cache)
+    for result in results:
+        seconds = '-' if result.seconds is None else f'{result.seconds:.3f}s'
+        source = ' (cached)' if result.cached else ''
+        answer = result.answer if result.answer is not None else ''
+        print(f'{result.task.key:<10} {result.status:<8} {seconds:>9}{source}  {answer}')
+    return 0 if all(result.status == 'ok' for result in results) else 1